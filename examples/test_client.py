@@ -1,14 +1,26 @@
 """Simple test client for the WebSocket server."""
 
+import argparse
 import asyncio
-import json
+import time
 import uuid
 
+import orjson
 import websockets
 
+# Markers of the final frame, matched without parsing in quiet mode. They
+# are anchored on the envelope field that follows the top-level status, so
+# a nested status (e.g. in tool_result data) isn't mistaken for the end
+_COMPLETE_MARKER = b'"status":"complete","chunk"'
+_ERROR_MARKERS = (b'"status":"error","chunk"', b'{"status":"error","error"')
 
-async def test_chat() -> None:
-    """Test the chat functionality."""
+
+async def test_chat(quiet: bool = False) -> None:
+    """Test the chat functionality.
+
+    Args:
+        quiet: Skip pretty-printing and full JSON parsing of responses
+    """
     uri = "ws://localhost:8000/ws/chat"
 
     async with websockets.connect(uri) as websocket:
@@ -20,14 +32,35 @@ async def test_chat() -> None:
             "request_id": request_id,
         }
 
-        print(f"Sending: {json.dumps(message, indent=2)}")
-        await websocket.send(json.dumps(message))
+        payload = orjson.dumps(message)
+        if not quiet:
+            pretty = orjson.dumps(message, option=orjson.OPT_INDENT_2).decode()
+            print(f"Sending: {pretty}")
+        await websocket.send(payload.decode())
 
         # Receive responses
+        start = time.perf_counter()
+        count = 0
         while True:
             response = await websocket.recv()
-            data = json.loads(response)
-            print(f"Received: {json.dumps(data, indent=2)}")
+            count += 1
+
+            if quiet:
+                # Server frames are binary, so the markers are searched in
+                # the raw bytes without decoding
+                assert isinstance(response, bytes)
+                if _COMPLETE_MARKER in response:
+                    elapsed = time.perf_counter() - start
+                    print(f"Chat completed: {count} messages in {elapsed:.3f}s")
+                    break
+                if any(marker in response for marker in _ERROR_MARKERS):
+                    print(f"Error: {response.decode()}")
+                    break
+                continue
+
+            data = orjson.loads(response)
+            pretty = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            print(f"Received: {pretty}")
 
             # Check if response is complete
             if data.get("status") == "complete":
@@ -40,9 +73,17 @@ async def test_chat() -> None:
 
 async def main() -> None:
     """Run the test client."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only report completion; useful when load testing",
+    )
+    args = parser.parse_args()
+
     print("Testing WebSocket connection...")
     try:
-        await test_chat()
+        await test_chat(quiet=args.quiet)
     except Exception as e:
         print(f"Connection failed: {e}")
         print("Make sure the server is running with: uv run python -m src.main")
@@ -1,7 +1,7 @@
 """Base adapter interface for LLM providers."""
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any
 
 from src.models.messages import ServerMessage
@@ -15,7 +15,7 @@ class LLMAdapter(ABC):
         self,
         message: str,
         request_id: str,
-        tools: list[dict[str, Any]] | None = None,
+        tools: Sequence[dict[str, Any]] | None = None,
         **kwargs: Any,
     ) -> AsyncGenerator[ServerMessage]:
         """Generate a response from the LLM provider.
@@ -23,7 +23,8 @@ class LLMAdapter(ABC):
         Args:
             message: User message
             request_id: Unique request identifier
-            tools: Optional list of available tools
+            tools: Optional available tools; shared between requests, so
+                adapters must not modify them
             **kwargs: Additional provider-specific parameters
 
         Yields:
@@ -1,28 +1,195 @@
 """OpenAI adapter implementation."""
 
 import asyncio
-import json
+import contextlib
+import functools
+import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from typing import Any
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel
+import httpx
+import orjson
+from openai import AsyncOpenAI, AsyncStream, DefaultAsyncHttpxClient
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, Choice
+from pydantic import BaseModel, JsonValue
 
 from src.adapters.base import LLMAdapter
+from src.mcp import MCPClient
+from src.mcp.models import MCPToolCall, MCPToolResult
+from src.mcp.tools import ToolRegistry
 from src.models.config import OpenAIConfig
-from src.models.messages import ResponseChunk, ResponseStatus, ServerMessage
-from src.utils.logging import get_logger
+from src.models.messages import (
+    ResponseChunk,
+    ResponseStatus,
+    ServerMessage,
+    TextChunk,
+    ToolCallChunk,
+    ToolResultChunk,
+)
+from src.utils.logging import TokenBucket, get_logger
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Return milliseconds elapsed since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
+@functools.cache
+def _get_mcp_clients() -> list[MCPClient] | None:
+    """Return the application's MCP clients, or None outside the server.
+
+    src.main imports this module, so the lookup is deferred to first use and
+    then cached; src.main only ever appends to the same list.
+    """
+    try:
+        from src.main import mcp_clients
+    except ImportError:
+        return None
+    return mcp_clients
+
+
+# Shared metadata for plain streamed chunks; treated as read-only
+_EMPTY_META: dict[str, Any] = {}
+
+# Fixed progress chunks of the two-phase MCP flow
+_MCP_START_CHUNK = TextChunk(
+    type="text",
+    data="Starting two-phase OpenAI MCP interaction...",
+    metadata={"phase": "start"},
+)
+_MCP_FINAL_CHUNK = TextChunk(
+    type="text",
+    data="Getting final response with tool results...",
+    metadata={"phase": "final_response"},
+)
+
+# Streamed text is batched into one chunk per interval or size limit
+_COALESCE_INTERVAL_S = 0.015
+_COALESCE_MAX_CHARS = 256
+
+# Upper bound on stream chunks read ahead of a slow consumer
+_READ_AHEAD = 64
 
 
 class ToolResult(BaseModel):
     """Model representing the result of a tool execution."""
 
     status: str
-    result: Any = None
+    result: JsonValue = None
     error: str | None = None
 
 
+async def _stream_events(
+    stream: AsyncStream[ChatCompletionChunk],
+) -> AsyncGenerator[str | Choice]:
+    """Read an OpenAI stream ahead of the consumer and coalesce its text.
+
+    A background task reads up to ``_READ_AHEAD`` chunks into a bounded
+    queue, so the upstream socket keeps draining while the caller is busy
+    sending, without unbounded buffering. Text deltas are merged and
+    released once ``_COALESCE_INTERVAL_S`` has passed since the previous
+    release or ``_COALESCE_MAX_CHARS`` is reached; a backlog that built up
+    while the consumer was slow therefore goes out as one chunk.
+
+    When the generator is closed, the reader task is stopped and the stream
+    is closed, releasing the upstream connection even if it wasn't drained.
+
+    Args:
+        stream: Streaming chat completion response
+
+    Yields:
+        str | Choice: Merged text, or a choice carrying tool calls or a
+        finish reason (any buffered text is yielded before it)
+
+    Raises:
+        Exception: Any error raised by the stream, after the text buffered
+        before it has been yielded
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[ChatCompletionChunk | Exception | None] = asyncio.Queue(
+        _READ_AHEAD
+    )
+
+    async def pump() -> None:
+        try:
+            async for chunk in stream:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    pump_task = asyncio.create_task(pump())
+    buf: list[str] = []
+    size = 0
+    last_release = loop.time()
+    try:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                if not buf:
+                    item = await queue.get()
+                else:
+                    # Hold buffered text only until the interval is up
+                    timeout = last_release + _COALESCE_INTERVAL_S - loop.time()
+                    try:
+                        item = await asyncio.wait_for(queue.get(), max(timeout, 0))
+                    except TimeoutError:
+                        yield "".join(buf)
+                        buf.clear()
+                        size = 0
+                        last_release = loop.time()
+                        continue
+
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                # Deliver the text that arrived before the failure first
+                if buf:
+                    yield "".join(buf)
+                raise item
+            if not item.choices:
+                continue
+            choice = item.choices[0]
+            delta = choice.delta
+
+            if delta.content:
+                buf.append(delta.content)
+                size += len(delta.content)
+                if (
+                    size >= _COALESCE_MAX_CHARS
+                    or loop.time() - last_release >= _COALESCE_INTERVAL_S
+                ):
+                    yield "".join(buf)
+                    buf.clear()
+                    size = 0
+                    last_release = loop.time()
+
+            if delta.tool_calls or choice.finish_reason:
+                # Keep buffered text ahead of the event it preceded
+                if buf:
+                    yield "".join(buf)
+                    buf.clear()
+                    size = 0
+                    last_release = loop.time()
+                yield choice
+
+        if buf:
+            yield "".join(buf)
+    finally:
+        pump_task.cancel()
+        # Wait for the reader to stop without swallowing our own cancellation
+        await asyncio.wait((pump_task,))
+        await stream.close()
+
+
 class OpenAIAdapter(LLMAdapter):
     """OpenAI API adapter."""
 
@@ -33,11 +200,41 @@ class OpenAIAdapter(LLMAdapter):
             config: OpenAI configuration
         """
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.api_key)
+        # One long-lived HTTP/2 pool so back-to-back requests reuse the
+        # upstream connection instead of paying a new TLS handshake
+        http_client = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=64,
+                keepalive_expiry=300,
+            ),
+        )
+        self.client = AsyncOpenAI(api_key=config.api_key, http_client=http_client)
         self.logger = get_logger(__name__)
+        # structlog filters by the stdlib level, so check it before doing
+        # work that only feeds a log line
+        self._stdlib_logger = logging.getLogger(__name__)
+        # Tracebacks are costly to format; allow about one per second
+        self._traceback_bucket = TokenBucket(rate=1.0)
         # Default timeout for tool execution
         self.tool_timeout: int = getattr(config, "tool_timeout", 30)
 
+        # Per-request settings, read from the config once
+        self._model = config.model
+        self._system_prompt = config.system_prompt
+        self._stream = config.stream
+        self._base_api_params: dict[str, Any] = {
+            "model": config.model,
+            "temperature": config.temperature,
+        }
+        self._standard_api_params: dict[str, Any] = {
+            **self._base_api_params,
+            "top_p": config.top_p,
+            "max_tokens": config.max_tokens,
+            "stream": config.stream,
+        }
+
     async def execute_mcp_tool(self, tool_call: dict[str, Any]) -> ToolResult:
         """Execute a tool call via MCP.
 
@@ -47,106 +244,63 @@ class OpenAIAdapter(LLMAdapter):
         Returns:
             ToolResult: Results from MCP tool execution
         """
-        from src.mcp.models import MCPToolCall
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             function_name = tool_call["function"]["name"]
-            function_args = json.loads(tool_call["function"]["arguments"])
+            function_args = orjson.loads(tool_call["function"]["arguments"])
 
-            # Create MCPToolCall from OpenAI format
-            mcp_tool_call = MCPToolCall(
+            # Create MCPToolCall from OpenAI format; the fields already have
+            # the right types, so skip validation
+            mcp_tool_call = MCPToolCall.model_construct(
                 id=tool_call.get("id", "unknown"),
                 name=function_name,
                 arguments=function_args,
             )
 
-            # Get the MCP clients from the main module
-            # This is a simple way to access the global clients
-            try:
-                from src.main import mcp_clients
-
-                if mcp_clients:
-                    # Try each MCP client until one succeeds
-                    last_error = None
-                    for client in mcp_clients:
-                        try:
-                            mcp_result = await client.execute_tool(mcp_tool_call)
-                            if not mcp_result.error:
-                                elapsed_ms = (time.time() - start_time) * 1000
-                                self.logger.info(
-                                    "mcp_tool_executed",
-                                    module="openai_adapter",
-                                    function_name=function_name,
-                                    elapsed_ms=elapsed_ms,
-                                )
-                                return ToolResult(
-                                    status="success", result=mcp_result.output
-                                )
-                            last_error = mcp_result.error
-                        except Exception as e:
-                            last_error = str(e)
-
-                    # If we get here, all clients failed
-                    return ToolResult(
-                        status="error",
-                        error=last_error or f"Tool '{function_name}' not found",
-                    )
-                else:
-                    # No MCP clients available, try local tools directly
-                    from src.mcp.tools import ToolRegistry
-
-                    tool_handler = ToolRegistry.get_tool(function_name)
-                    if tool_handler:
-                        mcp_result = await tool_handler.execute(mcp_tool_call)
-                        if not mcp_result.error:
-                            elapsed_ms = (time.time() - start_time) * 1000
-                            self.logger.info(
-                                "mcp_tool_executed",
-                                module="openai_adapter",
-                                function_name=function_name,
-                                elapsed_ms=elapsed_ms,
-                            )
-                            return ToolResult(
-                                status="success", result=mcp_result.output
-                            )
-                        else:
-                            return ToolResult(status="error", error=mcp_result.error)
-                    else:
-                        return ToolResult(
-                            status="error", error=f"Tool '{function_name}' not found"
+            error: str | None = None
+            # Every MCPClient resolves local tools from the same registry, so
+            # run a local tool once here with the full budget rather than
+            # once per client
+            tool_handler = ToolRegistry.get_tool(function_name)
+            if tool_handler:
+                mcp_result = await asyncio.wait_for(
+                    tool_handler.execute(mcp_tool_call), timeout=self.tool_timeout
+                )
+                if not mcp_result.error:
+                    return self._tool_success(function_name, mcp_result, start_ns)
+                error = mcp_result.error
+            elif mcp_clients := _get_mcp_clients():
+                # Try each remote server until one succeeds, splitting the tool
+                # budget so a slow server can't starve the ones after it
+                attempt_timeout = self.tool_timeout / len(mcp_clients)
+                for client in mcp_clients:
+                    try:
+                        mcp_result = await asyncio.wait_for(
+                            client.call_tool(mcp_tool_call),
+                            timeout=attempt_timeout,
                         )
-
-            except ImportError:
-                # Fall back to local tools only if main module not available
-                from src.mcp.tools import ToolRegistry
-
-                tool_handler = ToolRegistry.get_tool(function_name)
-                if tool_handler:
-                    mcp_result = await tool_handler.execute(mcp_tool_call)
+                    except TimeoutError:
+                        error = f"MCP server '{client.config.name}' timed out"
+                        continue
+                    except Exception as e:
+                        error = str(e)
+                        continue
                     if not mcp_result.error:
-                        elapsed_ms = (time.time() - start_time) * 1000
-                        self.logger.info(
-                            "mcp_tool_executed",
-                            module="openai_adapter",
-                            function_name=function_name,
-                            elapsed_ms=elapsed_ms,
-                        )
-                        return ToolResult(status="success", result=mcp_result.output)
-                    else:
-                        return ToolResult(status="error", error=mcp_result.error)
-                else:
-                    return ToolResult(
-                        status="error", error=f"Tool '{function_name}' not found"
-                    )
+                        return self._tool_success(function_name, mcp_result, start_ns)
+                    error = mcp_result.error
+
+            return ToolResult(
+                status="error",
+                error=error or f"Tool '{function_name}' not found",
+            )
 
         except TimeoutError:
             self.logger.error(
                 "mcp_tool_timeout",
                 module="openai_adapter",
                 tool=tool_call.get("function", {}).get("name", "unknown"),
-                elapsed_ms=(time.time() - start_time) * 1000,
+                elapsed_ms=_elapsed_ms(start_ns),
             )
             return ToolResult(status="error", error="Tool execution timed out")
 
@@ -156,16 +310,39 @@ class OpenAIAdapter(LLMAdapter):
                 module="openai_adapter",
                 tool=tool_call.get("function", {}).get("name", "unknown"),
                 error=str(e),
-                elapsed_ms=(time.time() - start_time) * 1000,
-                exc_info=True,
+                elapsed_ms=_elapsed_ms(start_ns),
+                exc_info=self._traceback_bucket.allow(),
             )
             return ToolResult(status="error", error=str(e))
 
+    def _tool_success(
+        self, function_name: str, mcp_result: MCPToolResult, start_ns: int
+    ) -> ToolResult:
+        """Log a successful tool execution and wrap its output.
+
+        Args:
+            function_name: Name of the executed tool
+            mcp_result: Successful MCP tool result
+            start_ns: time.perf_counter_ns() reading taken before execution
+
+        Returns:
+            ToolResult: Success result carrying the tool output
+        """
+        if self._stdlib_logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "mcp_tool_executed",
+                module="openai_adapter",
+                function_name=function_name,
+                elapsed_ms=_elapsed_ms(start_ns),
+            )
+        # Built from a trusted MCP result, so skip validation
+        return ToolResult.model_construct(status="success", result=mcp_result.output)
+
     async def generate_response(
         self,
         message: str,
         request_id: str,
-        tools: list[dict[str, Any]] | None = None,
+        tools: Sequence[dict[str, Any]] | None = None,
         use_mcp: bool = True,
         **kwargs: Any,
     ) -> AsyncGenerator[ServerMessage]:
@@ -181,13 +358,13 @@ class OpenAIAdapter(LLMAdapter):
         Yields:
             ServerMessage: Response chunks from OpenAI
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Send processing status
-        yield ServerMessage(
+        yield ServerMessage.model_construct(
             request_id=request_id,
             status=ResponseStatus.PROCESSING,
-            chunk=ResponseChunk(
+            chunk=ResponseChunk.model_construct(
                 type=None, data=None, metadata={"user_message": message}
             ),
             error=None,
@@ -196,38 +373,42 @@ class OpenAIAdapter(LLMAdapter):
         try:
             # Prepare messages
             messages = [
-                {"role": "system", "content": self.config.system_prompt},
+                {"role": "system", "content": self._system_prompt},
                 {"role": "user", "content": message},
             ]
 
             # If MCP is not enabled or no tools are provided, use standard flow
             if not use_mcp or not tools:
-                async for server_message in self._handle_standard_flow(
+                flow = self._handle_standard_flow(
                     messages=messages,
                     tools=tools,
                     request_id=request_id,
-                ):
-                    yield server_message
+                )
             else:
-                async for server_message in self._handle_mcp_flow(
+                flow = self._handle_mcp_flow(
                     messages=messages,
                     tools=tools,
                     request_id=request_id,
                     original_message=message,
-                ):
+                )
+
+            # Close the flow as soon as this generator is closed, so running
+            # tools and the upstream stream are released right away
+            async with contextlib.aclosing(flow):
+                async for server_message in flow:
                     yield server_message
 
             # Send completion status
-            elapsed_ms = (time.time() - start_time) * 1000
-            self.logger.info(
-                "openai_response_complete",
-                request_id=request_id,
-                elapsed_ms=elapsed_ms,
-                model=self.config.model,
-                mcp_used=use_mcp,
-            )
+            if self._stdlib_logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "openai_response_complete",
+                    request_id=request_id,
+                    elapsed_ms=_elapsed_ms(start_ns),
+                    model=self._model,
+                    mcp_used=use_mcp,
+                )
 
-            yield ServerMessage(
+            yield ServerMessage.model_construct(
                 request_id=request_id,
                 status=ResponseStatus.COMPLETE,
                 chunk=None,
@@ -239,9 +420,9 @@ class OpenAIAdapter(LLMAdapter):
                 "openai_error",
                 request_id=request_id,
                 error=str(e),
-                exc_info=True,
+                exc_info=self._traceback_bucket.allow(),
             )
-            yield ServerMessage(
+            yield ServerMessage.model_construct(
                 request_id=request_id,
                 status=ResponseStatus.ERROR,
                 error=f"OpenAI error: {str(e)}",
@@ -251,13 +432,20 @@ class OpenAIAdapter(LLMAdapter):
     async def validate_config(self) -> bool:
         """Validate OpenAI configuration.
 
+        The check goes through the adapter's pooled HTTP client, so it also
+        opens (and keeps alive) the upstream connection that the first chat
+        request will reuse.
+
         Returns:
             bool: True if configuration is valid
         """
         try:
-            # Test API key by listing models
-            await self.client.models.list()
-            self.logger.info("openai_config_valid")
+            # Test API key by listing models; this also warms the pool
+            response = await self.client.models.with_raw_response.list()
+            self.logger.info(
+                "openai_config_valid",
+                http_version=response.http_version,
+            )
             return True
         except Exception as e:
             self.logger.error("openai_config_invalid", error=str(e))
@@ -266,7 +454,7 @@ class OpenAIAdapter(LLMAdapter):
     async def _handle_standard_flow(
         self,
         messages: list[dict[str, str]],
-        tools: list[dict[str, Any]] | None,
+        tools: Sequence[dict[str, Any]] | None,
         request_id: str,
     ) -> AsyncGenerator[ServerMessage]:
         """Handle standard OpenAI flow without MCP.
@@ -280,71 +468,65 @@ class OpenAIAdapter(LLMAdapter):
             ServerMessage: Response chunks
         """
         # Prepare API call parameters
-        api_params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
-            "max_tokens": self.config.max_tokens,
-            "stream": self.config.stream,
-        }
+        api_params = dict(self._standard_api_params, messages=messages)
 
         # Add tools if provided
         if tools:
             api_params["tools"] = tools
             api_params["tool_choice"] = "auto"
 
+        # Only the chunk varies per streamed message; the fields are built
+        # here, so each message skips validation like the rest of the flow
+        make_chunk_message = functools.partial(
+            ServerMessage.model_construct,
+            request_id=request_id,
+            status=ResponseStatus.CHUNK,
+            error=None,
+        )
+
         # Make API call
-        if self.config.stream:
+        if self._stream:
             # Streaming response
             stream = await self.client.chat.completions.create(**api_params)
 
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield ServerMessage(
-                        request_id=request_id,
-                        status=ResponseStatus.CHUNK,
-                        chunk=ResponseChunk(
+            async for event in _stream_events(stream):
+                if isinstance(event, str):
+                    yield make_chunk_message(
+                        chunk=TextChunk.model_construct(
                             type="text",
-                            data=chunk.choices[0].delta.content,
-                            metadata={},
-                        ),
-                        error=None,
+                            data=event,
+                            metadata=_EMPTY_META,
+                        )
                     )
+                    continue
 
                 # Handle tool calls if present
-                if chunk.choices and chunk.choices[0].delta.tool_calls:
-                    for tool_call in chunk.choices[0].delta.tool_calls:
-                        yield ServerMessage(
-                            request_id=request_id,
-                            status=ResponseStatus.CHUNK,
-                            chunk=ResponseChunk(
-                                type="tool_call",
-                                data=tool_call.model_dump_json(),
-                                metadata={},
-                            ),
-                            error=None,
+                for tool_call in event.delta.tool_calls or ():
+                    yield make_chunk_message(
+                        chunk=ToolCallChunk.model_construct(
+                            type="tool_call",
+                            data=_json_dumps(tool_call.model_dump(exclude_none=True)),
+                            metadata=_EMPTY_META,
                         )
+                    )
         else:
             # Non-streaming response
             response = await self.client.chat.completions.create(**api_params)
 
-            if response.choices and response.choices[0].message.content:
-                yield ServerMessage(
-                    request_id=request_id,
-                    status=ResponseStatus.CHUNK,
-                    chunk=ResponseChunk(
+            content = response.choices[0].message.content if response.choices else None
+            if content:
+                yield make_chunk_message(
+                    chunk=TextChunk.model_construct(
                         type="text",
-                        data=response.choices[0].message.content,
-                        metadata={},
-                    ),
-                    error=None,
+                        data=content,
+                        metadata=_EMPTY_META,
+                    )
                 )
 
     async def _handle_mcp_flow(
         self,
         messages: list[dict[str, str]],
-        tools: list[dict[str, Any]],
+        tools: Sequence[dict[str, Any]],
         request_id: str,
         original_message: str,
     ) -> AsyncGenerator[ServerMessage]:
@@ -360,151 +542,204 @@ class OpenAIAdapter(LLMAdapter):
             ServerMessage: Response chunks
         """
         # Notify client we're starting MCP flow
-        yield ServerMessage(
+        yield ServerMessage.model_construct(
             request_id=request_id,
             status=ResponseStatus.CHUNK,
-            chunk=ResponseChunk(
-                type="text",
-                data="Starting two-phase OpenAI MCP interaction...",
-                metadata={"phase": "start"},
-            ),
+            chunk=_MCP_START_CHUNK,
             error=None,
         )
 
-        # First phase: Get tool calls from OpenAI
-        api_params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "tools": tools,
-            "tool_choice": "auto",
-            "stream": False,  # Two-phase works better with non-streaming first call
-        }
+        # First phase: Stream tool calls from OpenAI, starting each tool as
+        # soon as its arguments are complete
+        api_params = dict(
+            self._base_api_params,
+            messages=messages,
+            tools=tools,
+            tool_choice="auto",
+            stream=True,
+        )
 
-        response = await self.client.chat.completions.create(**api_params)
-        first_message = response.choices[0].message
+        content_parts: list[str] = []
+        tool_calls: dict[int, dict[str, Any]] = {}
+        tool_tasks: dict[int, asyncio.Task[ToolResult]] = {}
+
+        def start_tool_calls() -> None:
+            """Start execution of every buffered tool call not yet running."""
+            for index, tool_call in tool_calls.items():
+                if index not in tool_tasks:
+                    tool_tasks[index] = asyncio.create_task(
+                        asyncio.wait_for(
+                            self.execute_mcp_tool(tool_call),
+                            timeout=self.tool_timeout,
+                        )
+                    )
 
-        # If no tool calls, return the response directly
-        if not first_message.tool_calls:
-            yield ServerMessage(
+        try:
+            stream = await self.client.chat.completions.create(**api_params)
+            async for event in _stream_events(stream):
+                if isinstance(event, str):
+                    content_parts.append(event)
+                    yield ServerMessage.model_construct(
+                        request_id=request_id,
+                        status=ResponseStatus.CHUNK,
+                        chunk=TextChunk.model_construct(
+                            type="text", data=event, metadata=_EMPTY_META
+                        ),
+                        error=None,
+                    )
+                    continue
+
+                for tool_delta in event.delta.tool_calls or ():
+                    tool_call = tool_calls.get(tool_delta.index)
+                    if tool_call is None:
+                        # Tool calls are streamed in index order, so a new index
+                        # means every earlier call has its full arguments
+                        start_tool_calls()
+                        tool_call = tool_calls[tool_delta.index] = {
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""},
+                        }
+                    if tool_delta.id:
+                        tool_call["id"] = tool_delta.id
+                    function = tool_delta.function
+                    if function:
+                        if function.name:
+                            tool_call["function"]["name"] += function.name
+                        if function.arguments:
+                            tool_call["function"]["arguments"] += function.arguments
+
+                if event.finish_reason:
+                    start_tool_calls()
+
+            # In case the stream ended without a finish_reason
+            start_tool_calls()
+
+            # If no tool calls, the streamed text was the response
+            if not tool_calls:
+                if not content_parts:
+                    yield ServerMessage.model_construct(
+                        request_id=request_id,
+                        status=ResponseStatus.CHUNK,
+                        chunk=TextChunk.model_construct(
+                            type="text",
+                            data="No response generated",
+                            metadata={},
+                        ),
+                        error=None,
+                    )
+                return
+
+            # Process tool calls
+            yield ServerMessage.model_construct(
                 request_id=request_id,
                 status=ResponseStatus.CHUNK,
-                chunk=ResponseChunk(
+                chunk=TextChunk.model_construct(
                     type="text",
-                    data=first_message.content or "No response generated",
-                    metadata={},
+                    data=f"Executing {len(tool_calls)} tool calls...",
+                    metadata={
+                        "phase": "tool_execution",
+                        "count": len(tool_calls),
+                    },
                 ),
                 error=None,
             )
-            return
 
-        # Process tool calls
-        yield ServerMessage(
-            request_id=request_id,
-            status=ResponseStatus.CHUNK,
-            chunk=ResponseChunk(
-                type="text",
-                data=f"Executing {len(first_message.tool_calls)} tool calls...",
-                metadata={
-                    "phase": "tool_execution",
-                    "count": len(first_message.tool_calls),
-                },
-            ),
-            error=None,
-        )
+            ordered_calls = [tool_calls[index] for index in sorted(tool_calls)]
+            results = await asyncio.gather(
+                *(tool_tasks[index] for index in sorted(tool_calls)),
+                return_exceptions=True,
+            )
+        finally:
+            # Don't leave tools running if the client went away mid-stream
+            for task in tool_tasks.values():
+                task.cancel()
+            if tool_tasks:
+                await asyncio.wait(tool_tasks.values())
+
+        # Add the assistant's message with tool calls, carrying only the
+        # fields the API needs rather than a full pydantic dump
+        assistant_message: dict[str, Any] = {
+            "role": "assistant",
+            "tool_calls": ordered_calls,
+        }
+        if content_parts:
+            assistant_message["content"] = "".join(content_parts)
 
         # Prepare for second phase
         second_phase_messages = [
-            {"role": "system", "content": self.config.system_prompt},
+            {"role": "system", "content": self._system_prompt},
             {"role": "user", "content": original_message},
-            first_message.model_dump(),  # Add the assistant's message with tool calls
+            assistant_message,
         ]
 
-        # Execute each tool call and add results
-        for tool_call in first_message.tool_calls:
-            # Execute the tool via MCP with timeout protection
-            try:
-                result = await asyncio.wait_for(
-                    self.execute_mcp_tool(tool_call.model_dump()),
-                    timeout=self.tool_timeout,
-                )
-
-                # Send tool execution progress to client
-                yield ServerMessage(
-                    request_id=request_id,
-                    status=ResponseStatus.CHUNK,
-                    chunk=ResponseChunk(
-                        type="tool_result",
-                        data=json.dumps(
-                            {
-                                "tool": tool_call.function.name,
-                                "status": "complete",
-                            }
-                        ),
-                        metadata={"tool_id": tool_call.id},
-                    ),
-                    error=None,
-                )
-
-                # Add tool result to messages for second phase
-                second_phase_messages.append(
-                    {
-                        "tool_call_id": tool_call.id,
-                        "role": "tool",
-                        "content": json.dumps(result.model_dump()),
-                    }
-                )
-
-            except Exception as e:
+        # Add results in the order the tool calls were requested
+        for tool_call, result in zip(ordered_calls, results, strict=True):
+            tool_name = tool_call["function"]["name"]
+            if isinstance(result, BaseException):
                 self.logger.error(
                     "mcp_tool_error",
                     module="openai_adapter",
-                    tool=tool_call.function.name,
-                    error=str(e),
-                    exc_info=True,
+                    tool=tool_name,
+                    error=str(result),
+                    exc_info=result if self._traceback_bucket.allow() else False,
                 )
 
                 # Add error result to messages
                 second_phase_messages.append(
                     {
-                        "tool_call_id": tool_call.id,
+                        "tool_call_id": tool_call["id"],
                         "role": "tool",
-                        "content": json.dumps({"error": str(e)}),
+                        "content": _json_dumps({"error": str(result)}),
                     }
                 )
+                continue
+
+            # Send tool execution progress to client
+            yield ServerMessage.model_construct(
+                request_id=request_id,
+                status=ResponseStatus.CHUNK,
+                chunk=ToolResultChunk.model_construct(
+                    type="tool_result",
+                    data={"tool": tool_name, "status": "complete"},
+                    metadata={"tool_id": tool_call["id"]},
+                ),
+                error=None,
+            )
+
+            # Add tool result to messages for second phase
+            second_phase_messages.append(
+                {
+                    "tool_call_id": tool_call["id"],
+                    "role": "tool",
+                    "content": _json_dumps(result.model_dump()),
+                }
+            )
 
         # Second phase: Get final response with tool outputs
-        yield ServerMessage(
+        yield ServerMessage.model_construct(
             request_id=request_id,
             status=ResponseStatus.CHUNK,
-            chunk=ResponseChunk(
-                type="text",
-                data="Getting final response with tool results...",
-                metadata={"phase": "final_response"},
-            ),
+            chunk=_MCP_FINAL_CHUNK,
             error=None,
         )
 
-        second_params = {
-            "model": self.config.model,
-            "messages": second_phase_messages,
-            "temperature": self.config.temperature,
-            "stream": self.config.stream,
-        }
+        second_params = dict(
+            self._base_api_params,
+            messages=second_phase_messages,
+            stream=self._stream,
+        )
 
-        if self.config.stream:
+        if self._stream:
             # Stream the final response
             stream = await self.client.chat.completions.create(**second_params)
-
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield ServerMessage(
+            async for event in _stream_events(stream):
+                if isinstance(event, str):
+                    yield ServerMessage.model_construct(
                         request_id=request_id,
                         status=ResponseStatus.CHUNK,
-                        chunk=ResponseChunk(
-                            type="text",
-                            data=chunk.choices[0].delta.content,
-                            metadata={},
+                        chunk=TextChunk.model_construct(
+                            type="text", data=event, metadata=_EMPTY_META
                         ),
                         error=None,
                     )
@@ -512,13 +747,15 @@ class OpenAIAdapter(LLMAdapter):
             # Non-streaming final response
             final_response = await self.client.chat.completions.create(**second_params)
 
-            if final_response.choices and final_response.choices[0].message.content:
-                yield ServerMessage(
+            choices = final_response.choices
+            content = choices[0].message.content if choices else None
+            if content:
+                yield ServerMessage.model_construct(
                     request_id=request_id,
                     status=ResponseStatus.CHUNK,
-                    chunk=ResponseChunk(
+                    chunk=TextChunk.model_construct(
                         type="text",
-                        data=final_response.choices[0].message.content,
+                        data=content,
                         metadata={},
                     ),
                     error=None,
@@ -1,38 +1,46 @@
 """Main application entry point."""
 
+import asyncio
+import functools
+import importlib.util
 import os
+import secrets
 import sys
-import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, WebSocket
+from fastapi import APIRouter, FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.adapters import OpenAIAdapter
 from src.mcp import MCPClient
 from src.models.config import Config, Settings
 from src.server import WebSocketServer
-from src.utils.logging import setup_logging
+from src.utils import get_logger, load_config, setup_logging
 
 # Load environment variables early
 load_dotenv()
 
+logger = get_logger(__name__)
+
 # Global variables for lifecycle management
 config: Config
 ws_server: WebSocketServer
 mcp_clients: list[MCPClient] = []
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Application lifespan manager."""
-    global config, ws_server, mcp_clients
+@functools.cache
+def _bootstrap() -> tuple[Config, Settings]:
+    """Load the config file and environment settings once per process.
 
+    Returns:
+        The configuration with environment overrides applied, and the settings
+    """
     # Load configuration
     config_path = os.getenv("CONFIG_PATH", "config.yaml")
-    config = Config.from_yaml(config_path)
+    config = load_config(config_path)
 
     # Load environment settings
     settings = Settings()
@@ -47,8 +55,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     if settings.log_level:
         config.logging.level = settings.log_level
 
+    return config, settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """Application lifespan manager."""
+    global config, ws_server, mcp_clients
+
+    config, settings = _bootstrap()
+
     # Setup logging
-    setup_logging(config.logging.level, config.logging.format)
+    setup_logging(
+        config.logging.level,
+        config.logging.format,
+        tracebacks=settings.debug_tracebacks,
+    )
+    logger.info("event_loop", impl=type(asyncio.get_running_loop()).__name__)
 
     # Initialize OpenAI adapter
     openai_adapter = OpenAIAdapter(config.openai)
@@ -58,6 +81,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         print("Failed to validate OpenAI configuration. Check your API key.")
         sys.exit(1)
 
+    # One pooled HTTP client serves every MCP server
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+        http2=True,
+        timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0),
+    )
+    app.state.http_client = http_client
+
     # Initialize MCP clients
     if config.mcp.enabled:
         # Always create at least one MCP client for local tools
@@ -73,17 +104,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
                 auth_token=None,
                 bind_localhost=True,
             )
-            client = MCPClient(dummy_config)
+            client = MCPClient(dummy_config, http_client)
             # Don't initialize the dummy client (no remote server)
             mcp_clients.append(client)
         else:
-            for server_config in config.mcp.servers:
-                try:
-                    client = MCPClient(server_config)
-                    await client.initialize()
+            # Connect to all servers concurrently
+            clients = [
+                MCPClient(server_config, http_client)
+                for server_config in config.mcp.servers
+            ]
+            results = await asyncio.gather(
+                *(client.initialize() for client in clients),
+                return_exceptions=True,
+            )
+            for client, result in zip(clients, results, strict=True):
+                if isinstance(result, BaseException):
+                    name = client.config.name
+                    print(f"Failed to initialize MCP server {name}: {result}")
+                else:
                     mcp_clients.append(client)
-                except Exception as e:
-                    print(f"Failed to initialize MCP server {server_config.name}: {e}")
 
     # Initialize WebSocket server
     ws_server = WebSocketServer(config, openai_adapter, mcp_clients)
@@ -91,28 +130,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     yield
 
     # Cleanup
-    for client in mcp_clients:
-        await client.close()
+    await http_client.aclose()
 
 
-# Create FastAPI app
-app = FastAPI(
-    title="Multi-Vendor LLM Backend",
-    version="0.1.0",
-    lifespan=lifespan,
-)
+router = APIRouter()
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Will be configured from config
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-
-@app.get("/")
+@router.get("/")
 async def root() -> dict:
     """Root endpoint."""
     return {
@@ -122,7 +146,7 @@ async def root() -> dict:
     }
 
 
-@app.get("/health")
+@router.get("/health")
 async def health() -> dict:
     """Health check endpoint."""
     return {
@@ -132,28 +156,32 @@ async def health() -> dict:
     }
 
 
-@app.websocket("/ws/chat")
+@router.websocket("/ws/chat")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """WebSocket endpoint for chat."""
-    client_id = str(uuid.uuid4())
+    client_id = secrets.token_urlsafe(12)
     await ws_server.connect(websocket, client_id)
     await ws_server.handle_message(websocket, client_id)
 
 
-def main() -> None:
-    """Run the application."""
-    import uvicorn
+def create_app() -> FastAPI:
+    """Create the FastAPI application.
 
-    # Get configuration
-    config_path = os.getenv("CONFIG_PATH", "config.yaml")
-    config = Config.from_yaml(config_path)
+    Used as a uvicorn factory so that importing this module neither reads
+    the config file nor the environment.
 
-    # Apply environment overrides
-    settings = Settings()
-    host = settings.server_host or config.server.host
-    port = settings.server_port or config.server.port
+    Returns:
+        The application with CORS and all routes configured
+    """
+    config, _ = _bootstrap()
 
-    # Update CORS origins
+    app = FastAPI(
+        title="Multi-Vendor LLM Backend",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
+
+    # Add CORS middleware once, with the configured origins
     app.add_middleware(
         CORSMiddleware,
         allow_origins=config.server.cors_origins,
@@ -161,14 +189,48 @@ def main() -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.include_router(router)
+
+    return app
+
+
+def _event_loop() -> str:
+    """Choose the event loop implementation for uvicorn.
+
+    uvicorn's "auto" setting already uses uvloop where it is installed and
+    falls back to asyncio otherwise. uvloop doesn't support Windows, so
+    winloop is used there when available.
+
+    Returns:
+        The value for uvicorn's ``loop`` option
+    """
+    if sys.platform == "win32" and importlib.util.find_spec("winloop") is not None:
+        return "winloop:new_event_loop"
+    return "auto"
+
+
+def main() -> None:
+    """Run the application."""
+    import uvicorn
+
+    config, settings = _bootstrap()
 
-    # Run server
+    # Run server; uvicorn's access log is off by default because requests
+    # are already covered by the structured logs
     uvicorn.run(
-        "src.main:app",
-        host=host,
-        port=port,
-        reload=True,
+        "src.main:create_app",
+        factory=True,
+        host=config.server.host,
+        port=config.server.port,
+        reload=settings.uvicorn_reload,
+        workers=None if settings.uvicorn_reload else settings.uvicorn_workers,
+        access_log=settings.uvicorn_access_log,
         log_level=config.logging.level.lower(),
+        # C-accelerated loop and parsers; the loop falls back to asyncio
+        # where neither uvloop nor winloop is installed
+        loop=_event_loop(),
+        http="httptools",
+        ws="websockets",
     )
 
 
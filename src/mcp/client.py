@@ -1,13 +1,15 @@
 """MCP client for connecting to MCP servers."""
 
-import uuid
+import itertools
+import secrets
 from typing import Any
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from src.mcp.models import (
     MCPCapabilities,
-    MCPRequest,
     MCPResponse,
     MCPTool,
     MCPToolCall,
@@ -16,30 +18,45 @@ from src.mcp.models import (
 from src.models.config import MCPServerConfig
 from src.utils.logging import get_logger
 
+# MCP protocol revision requested in the initialize handshake
+MCP_PROTOCOL_VERSION = "2024-11-05"
+_CLIENT_INFO = {"name": "llm-backend", "version": "0.1.0"}
+
+# Validates a whole tools/list result in one call
+_TOOLS_ADAPTER = TypeAdapter(list[MCPTool])
+
+# URL prefixes accepted for servers marked bind_localhost
+_LOCALHOST_PREFIXES = (
+    "http://127.0.0.1",
+    "http://localhost",
+    "https://127.0.0.1",
+    "https://localhost",
+)
+
 
 class MCPClient:
     """Client for interacting with MCP servers."""
 
-    def __init__(self, server_config: MCPServerConfig) -> None:
+    def __init__(
+        self, server_config: MCPServerConfig, http_client: httpx.AsyncClient
+    ) -> None:
         """Initialize MCP client.
 
         Args:
             server_config: MCP server configuration
+            http_client: Shared connection pool used for all MCP servers
         """
         self.config = server_config
         self.logger = get_logger(__name__)
 
         # Prepare headers for authentication and security
-        headers = {"Content-Type": "application/json"}
+        self._headers = {"Content-Type": "application/json"}
         if server_config.auth_token:
-            headers["Authorization"] = f"Bearer {server_config.auth_token}"
+            self._headers["Authorization"] = f"Bearer {server_config.auth_token}"
 
         # Validate URL for security
-        if server_config.bind_localhost and not (
-            server_config.url.startswith("http://127.0.0.1")
-            or server_config.url.startswith("http://localhost")
-            or server_config.url.startswith("https://127.0.0.1")
-            or server_config.url.startswith("https://localhost")
+        if server_config.bind_localhost and not server_config.url.startswith(
+            _LOCALHOST_PREFIXES
         ):
             self.logger.warning(
                 "mcp_security_warning",
@@ -48,14 +65,27 @@ class MCPClient:
                 message="Non-localhost URL with bind_localhost=True",
             )
 
-        self.client = httpx.AsyncClient(
-            base_url=server_config.url,
-            timeout=server_config.timeout,
-            headers=headers,
+        # The pool is shared, so the URL and read timeout go on each request
+        self.client = http_client
+        self._url = server_config.url.rstrip("/") + "/"
+        shared_timeout = http_client.timeout
+        self._timeout = httpx.Timeout(
+            connect=shared_timeout.connect,
+            read=server_config.timeout,
+            write=shared_timeout.write,
+            pool=shared_timeout.pool,
         )
         self._capabilities: MCPCapabilities | None = None
         self._session_id: str | None = None
 
+        # RPC ids only need to be unique per client: a random prefix plus a counter
+        self._client_nonce = secrets.token_hex(4)
+        self._rpc_counter = itertools.count()
+
+        # Derived from _capabilities; rebuilt only by _set_capabilities
+        self._openai_tools_cache: tuple[dict[str, Any], ...] = ()
+        self._tools_cache: list[MCPTool] | None = None
+
     async def initialize(self) -> None:
         """Initialize connection to MCP server."""
         try:
@@ -63,25 +93,23 @@ class MCPClient:
             response = await self._send_request(
                 method="initialize",
                 params={
-                    "protocolVersion": "2024-11-05",  # Updated to current MCP version
-                    "clientInfo": {
-                        "name": "llm-backend",
-                        "version": "0.1.0",
-                    },
+                    "protocolVersion": MCP_PROTOCOL_VERSION,
+                    "clientInfo": _CLIENT_INFO,
                 },
             )
 
-            if response.result:
+            init_result = response.result
+            if init_result and isinstance(init_result, dict):
                 # Get server capabilities
                 caps_response = await self._send_request(method="tools/list")
-                if caps_response.result:
-                    tools = [
-                        MCPTool(**tool)
-                        for tool in caps_response.result.get("tools", [])
-                    ]
-                    self._capabilities = MCPCapabilities(
-                        tools=tools,
-                        version=response.result.get("protocolVersion", "1.0"),
+                caps_result = caps_response.result
+                if caps_result and isinstance(caps_result, dict):
+                    tools = _TOOLS_ADAPTER.validate_python(caps_result.get("tools", []))
+                    self._set_capabilities(
+                        MCPCapabilities(
+                            tools=tools,
+                            version=str(init_result.get("protocolVersion", "1.0")),
+                        )
                     )
                     self.logger.info(
                         "mcp_initialized",
@@ -100,27 +128,26 @@ class MCPClient:
     async def get_tools(self) -> list[MCPTool]:
         """Get available tools from the server and local registry.
 
+        The combined list is built once per capabilities update; treat it
+        as read-only.
+
         Returns:
             List of available tools combining local and remote tools
         """
         from src.mcp.tools import ToolRegistry
 
-        # Get local tools
-        local_tools = ToolRegistry.get_tools()
-
         # If not connected to remote MCP, just return local tools
         if not self._capabilities:
-            return local_tools
+            return ToolRegistry.get_tools()
 
-        # Combine local and remote tools
-        remote_tools = self._capabilities.tools if self._capabilities else []
+        if self._tools_cache is None:
+            # Deduplicate tools by name (local tools take precedence)
+            tools_dict = {tool.name: tool for tool in self._capabilities.tools}
+            for tool in ToolRegistry.get_tools():
+                tools_dict[tool.name] = tool
+            self._tools_cache = list(tools_dict.values())
 
-        # Create a dict to deduplicate tools by name (local tools take precedence)
-        tools_dict = {tool.name: tool for tool in remote_tools}
-        for tool in local_tools:
-            tools_dict[tool.name] = tool
-
-        return list(tools_dict.values())
+        return self._tools_cache
 
     async def execute_tool(self, tool_call: MCPToolCall) -> MCPToolResult:
         """Execute a tool call using local tools or remote MCP servers.
@@ -190,8 +217,8 @@ class MCPClient:
                 "mcp_tool_call_failed",
                 tool=tool_call.name,
                 error=str(e),
-                exc_info=True,
             )
+            self.logger.debug("mcp_tool_call_trace", tool=tool_call.name, exc_info=True)
             return MCPToolResult(
                 tool_call_id=tool_call.id,
                 output=None,
@@ -212,21 +239,26 @@ class MCPClient:
         Returns:
             MCP response
         """
-        request = MCPRequest(
-            method=method,
-            params=params,
-            id=str(uuid.uuid4()),
-        )
+        # The request shape is fixed, so build it directly rather than
+        # through a validated model
+        body: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "id": f"{self._client_nonce}-{next(self._rpc_counter)}",
+        }
+        if params is not None:
+            body["params"] = params
 
         # Prepare headers for session management
-        headers = {"Content-Type": "application/json"}
+        headers = self._headers
         if self._session_id:
-            headers["Mcp-Session-Id"] = self._session_id
+            headers = {**headers, "Mcp-Session-Id": self._session_id}
 
         response = await self.client.post(
-            "/",
-            json=request.model_dump(exclude_none=True),
+            self._url,
+            content=orjson.dumps(body),
             headers=headers,
+            timeout=self._timeout,
         )
         response.raise_for_status()
 
@@ -239,32 +271,41 @@ class MCPClient:
                 session_id=self._session_id,
             )
 
-        return MCPResponse(**response.json())
-
-    async def close(self) -> None:
-        """Close the client connection."""
-        await self.client.aclose()
+        data = orjson.loads(response.content)
+        return MCPResponse.model_construct(
+            jsonrpc=data.get("jsonrpc", "2.0"),
+            result=data.get("result"),
+            error=data.get("error"),
+            id=data.get("id"),
+        )
 
-    def to_openai_tools(self) -> list[dict[str, Any]]:
+    def to_openai_tools(self) -> tuple[dict[str, Any], ...]:
         """Convert MCP tools to OpenAI tool format.
 
+        The tuple is built when capabilities are set; its dicts are shared,
+        so treat them as read-only.
+
         Returns:
-            List of tools in OpenAI format
+            Tools in OpenAI format
         """
-        if not self._capabilities:
-            return []
-
-        openai_tools = []
-        for tool in self._capabilities.tools:
-            openai_tools.append(
-                {
-                    "type": "function",
-                    "function": {
-                        "name": f"{self.config.name}_{tool.name}",
-                        "description": tool.description,
-                        "parameters": tool.input_schema,
-                    },
-                }
-            )
+        return self._openai_tools_cache
 
-        return openai_tools
+    def _set_capabilities(self, capabilities: MCPCapabilities) -> None:
+        """Store server capabilities and rebuild the derived tool lists.
+
+        Args:
+            capabilities: Capabilities reported by the server
+        """
+        self._capabilities = capabilities
+        self._tools_cache = None
+        self._openai_tools_cache = tuple(
+            {
+                "type": "function",
+                "function": {
+                    "name": f"{self.config.name}_{tool.name}",
+                    "description": tool.description,
+                    "parameters": tool.input_schema,
+                },
+            }
+            for tool in capabilities.tools
+        )
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, JsonValue
 
 
 class MCPTool(BaseModel):
@@ -25,7 +25,7 @@ class MCPToolResult(BaseModel):
     """MCP tool execution result."""
 
     tool_call_id: str = Field(..., description="Tool call ID")
-    output: Any = Field(..., description="Tool output")
+    output: JsonValue = Field(..., description="Tool output")
     error: str | None = Field(None, description="Error message if failed")
 
 
@@ -42,7 +42,7 @@ class MCPResponse(BaseModel):
     """MCP response format."""
 
     jsonrpc: str = Field(default="2.0", description="JSON-RPC version")
-    result: Any | None = Field(None, description="Method result")
+    result: JsonValue = Field(None, description="Method result")
     error: dict[str, Any] | None = Field(None, description="Error details")
     id: str | None = Field(None, description="Request ID")
 
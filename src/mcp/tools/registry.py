@@ -11,7 +11,10 @@ logger = get_logger(__name__)
 class ToolRegistry:
     """Registry for MCP tools."""
 
-    _tools: ClassVar[dict[str, type["MCPToolHandler"]]] = {}
+    # Handlers with their definition, keyed by lower-cased tool name; the
+    # definition is built once at registration
+    _tools: ClassVar[dict[str, tuple[type["MCPToolHandler"], MCPTool]]] = {}
+    _definitions: ClassVar[list[MCPTool]] = []
 
     @classmethod
     def register(cls, tool_handler: type["MCPToolHandler"]) -> type["MCPToolHandler"]:
@@ -24,13 +27,14 @@ class ToolRegistry:
             The registered tool handler class (for decorator usage)
         """
         tool_def = tool_handler.get_definition()
-        cls._tools[tool_def.name] = tool_handler
+        cls._tools[tool_def.name.lower()] = (tool_handler, tool_def)
+        cls._definitions = [definition for _, definition in cls._tools.values()]
         logger.info("mcp_tool_registered", tool=tool_def.name)
         return tool_handler
 
     @classmethod
     def get_tool(cls, name: str) -> type["MCPToolHandler"] | None:
-        """Get a tool handler by name.
+        """Get a tool handler by name, ignoring case.
 
         Args:
             name: The tool name
@@ -38,7 +42,8 @@ class ToolRegistry:
         Returns:
             The tool handler class if found, None otherwise
         """
-        return cls._tools.get(name)
+        entry = cls._tools.get(name.lower())
+        return entry[0] if entry else None
 
     @classmethod
     def get_tools(cls) -> list[MCPTool]:
@@ -47,7 +52,7 @@ class ToolRegistry:
         Returns:
             List of all registered tool definitions
         """
-        return [handler.get_definition() for handler in cls._tools.values()]
+        return cls._definitions.copy()
 
 
 class MCPToolHandler:
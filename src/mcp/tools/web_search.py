@@ -1,10 +1,13 @@
 """Web search tool for MCP using DuckDuckGo."""
 
 import asyncio
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
 from ddgs import DDGS
+from pydantic import JsonValue
 
 from src.mcp.models import MCPTool, MCPToolCall, MCPToolResult
 from src.mcp.tools.registry import MCPToolHandler, ToolRegistry
@@ -12,6 +15,67 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared pool for the blocking DDGS calls; threads are reused across searches
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ddg")
+
+# One DDGS session per worker thread, since DDGS is not documented as
+# thread-safe; each keeps its HTTP connections and cookies between searches
+_thread_state = threading.local()
+
+
+def _get_ddgs() -> DDGS:
+    """Return the calling thread's DDGS session, creating it on first use.
+
+    Returns:
+        The thread-local DDGS instance
+    """
+    ddgs: DDGS | None = getattr(_thread_state, "ddgs", None)
+    if ddgs is None:
+        ddgs = _thread_state.ddgs = DDGS()
+    return ddgs
+
+
+# Recent formatted results keyed by (normalized query, num_results). Only
+# touched from the event loop, so no lock is needed
+_SEARCH_CACHE: OrderedDict[tuple[str, int], tuple[float, list[JsonValue]]] = (
+    OrderedDict()
+)
+_SEARCH_CACHE_MAX = 256
+_SEARCH_TTL_S = 300.0
+
+
+def _cache_get(key: tuple[str, int]) -> list[JsonValue] | None:
+    """Return cached results for a search if present and not expired.
+
+    Args:
+        key: Normalized query and result count
+
+    Returns:
+        The cached formatted results, or None on a miss
+    """
+    entry = _SEARCH_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, results = entry
+    if time.monotonic() - stored_at >= _SEARCH_TTL_S:
+        del _SEARCH_CACHE[key]
+        return None
+    _SEARCH_CACHE.move_to_end(key)
+    return results
+
+
+def _cache_put(key: tuple[str, int], results: list[JsonValue]) -> None:
+    """Store search results, evicting the least recently used beyond the cap.
+
+    Args:
+        key: Normalized query and result count
+        results: Formatted search results
+    """
+    _SEARCH_CACHE[key] = (time.monotonic(), results)
+    _SEARCH_CACHE.move_to_end(key)
+    while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.popitem(last=False)
+
 
 @ToolRegistry.register
 class WebSearchTool(MCPToolHandler):
@@ -72,40 +136,46 @@ class WebSearchTool(MCPToolHandler):
         num_results = max(1, min(10, num_results))
 
         try:
-            logger.info(
-                "web_search_started",
-                query=query,
-                num_results=num_results,
-                tool_call_id=tool_call.id,
-            )
-
-            # Perform the search in a thread executor since DDGS.text is blocking
-            def _search() -> list[dict[str, str]]:
-                ddgs = DDGS()
-                results = list(ddgs.text(query, max_results=num_results))
-                logger.info("raw_search_results", count=len(results), query=query)
-                return results
-
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                raw_results = await loop.run_in_executor(executor, _search)
-
-            # Format results
-            formatted_results = []
-            for result in raw_results:
-                formatted_results.append(
-                    {
-                        "title": result.get("title", ""),
-                        "snippet": result.get("body", ""),
-                        "url": result.get("href", ""),
-                    }
+            cache_key = (query.strip().lower(), num_results)
+            cached_results = _cache_get(cache_key)
+            formatted_results: list[JsonValue]
+            if cached_results is not None:
+                formatted_results = cached_results
+            else:
+                logger.info(
+                    "web_search_started",
+                    query=query,
+                    num_results=num_results,
+                    tool_call_id=tool_call.id,
                 )
 
+                # Perform the search in a thread executor since DDGS.text is blocking
+                def _search() -> list[dict[str, str]]:
+                    results = list(_get_ddgs().text(query, max_results=num_results))
+                    logger.info("raw_search_results", count=len(results), query=query)
+                    return results
+
+                loop = asyncio.get_running_loop()
+                raw_results = await loop.run_in_executor(_SEARCH_EXECUTOR, _search)
+
+                # Format results
+                formatted_results = []
+                for result in raw_results:
+                    formatted_results.append(
+                        {
+                            "title": result.get("title", ""),
+                            "snippet": result.get("body", ""),
+                            "url": result.get("href", ""),
+                        }
+                    )
+                _cache_put(cache_key, formatted_results)
+
             elapsed_ms = (time.time() - start_time) * 1000
             logger.info(
                 "web_search_completed",
                 query=query,
                 num_results=len(formatted_results),
+                cached=cached_results is not None,
                 elapsed_ms=elapsed_ms,
                 tool_call_id=tool_call.id,
             )
@@ -143,8 +213,8 @@ class WebSearchTool(MCPToolHandler):
                 error=str(e),
                 elapsed_ms=elapsed_ms,
                 tool_call_id=tool_call.id,
-                exc_info=True,
             )
+            logger.debug("web_search_trace", tool_call_id=tool_call.id, exc_info=True)
             return MCPToolResult(
                 tool_call_id=tool_call.id,
                 output=None,
@@ -1,17 +1,27 @@
 """Data models for WebSocket messages and configurations."""
 
 from .messages import (
+    CLIENT_MESSAGE_ADAPTER,
+    SERVER_MESSAGE_ADAPTER,
     ChatPayload,
     ClientMessage,
     ResponseChunk,
     ResponseStatus,
     ServerMessage,
+    TextChunk,
+    ToolCallChunk,
+    ToolResultChunk,
 )
 
 __all__ = [
+    "CLIENT_MESSAGE_ADAPTER",
+    "SERVER_MESSAGE_ADAPTER",
     "ChatPayload",
     "ClientMessage",
     "ResponseChunk",
     "ResponseStatus",
     "ServerMessage",
+    "TextChunk",
+    "ToolCallChunk",
+    "ToolResultChunk",
 ]
@@ -7,6 +7,11 @@ from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
 # Load environment variables early
 load_dotenv()
 
@@ -102,7 +107,7 @@ class Config(BaseModel):
     def from_yaml(cls, path: str) -> "Config":
         """Load configuration from YAML file."""
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAMLLoader)
         return cls(**data)
 
 
@@ -122,3 +127,9 @@ class Settings(BaseSettings):
     server_host: str | None = None
     server_port: int | None = None
     log_level: str | None = None
+    debug_tracebacks: bool = False
+
+    # uvicorn process settings; reload is for development only
+    uvicorn_reload: bool = False
+    uvicorn_workers: int = Field(default=1, gt=0)
+    uvicorn_access_log: bool = False
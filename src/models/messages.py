@@ -1,9 +1,13 @@
 """WebSocket message models for client-server communication."""
 
 from enum import Enum
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Messages are immutable frames: freezing them makes sharing instances
+# (e.g. constant chunks) safe and lets validation reuse nested models as-is
+_MESSAGE_CONFIG = ConfigDict(frozen=True, revalidate_instances="never", extra="forbid")
 
 
 class ResponseStatus(str, Enum):
@@ -18,12 +22,16 @@ class ResponseStatus(str, Enum):
 class ChatPayload(BaseModel):
     """Payload for chat action."""
 
+    model_config = _MESSAGE_CONFIG
+
     text: str = Field(..., description="User message text")
 
 
 class ClientMessage(BaseModel):
     """Message sent from client to server."""
 
+    model_config = _MESSAGE_CONFIG
+
     action: Literal["chat"] = Field(..., description="Action to perform")
     payload: ChatPayload = Field(..., description="Action payload")
     request_id: str = Field(..., description="Unique request identifier")
@@ -32,23 +40,53 @@ class ClientMessage(BaseModel):
 class ResponseChunk(BaseModel):
     """Chunk of response data."""
 
+    model_config = _MESSAGE_CONFIG
+
     type: Literal["text", "tool_call", "tool_result"] | None = Field(
         None, description="Type of chunk"
     )
-    data: str | None = Field(None, description="Chunk data")
+    data: str | dict[str, Any] | None = Field(
+        None, description="Chunk data; structured payloads are sent as objects"
+    )
     metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
 
 
+class TextChunk(ResponseChunk):
+    """Chunk of streamed response text."""
+
+    type: Literal["text"] = "text"
+
+
+class ToolCallChunk(ResponseChunk):
+    """Chunk describing a tool call requested by the model."""
+
+    type: Literal["tool_call"] = "tool_call"
+
+
+class ToolResultChunk(ResponseChunk):
+    """Chunk reporting the result of a tool execution."""
+
+    type: Literal["tool_result"] = "tool_result"
+
+
+# Typed chunks are dispatched on their tag; untyped chunks (e.g. processing
+# metadata) fall back to the base model
+TypedChunk = Annotated[
+    TextChunk | ToolCallChunk | ToolResultChunk, Field(discriminator="type")
+]
+
+
 class ServerMessage(BaseModel):
     """Message sent from server to client."""
 
     request_id: str = Field(..., description="Request identifier")
     status: ResponseStatus = Field(..., description="Response status")
-    chunk: ResponseChunk | None = Field(None, description="Response chunk")
+    chunk: TypedChunk | ResponseChunk | None = Field(None, description="Response chunk")
     error: str | None = Field(None, description="Error message if status is error")
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        **_MESSAGE_CONFIG,
+        json_schema_extra={
             "examples": [
                 {
                     "request_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -70,5 +108,10 @@ class ServerMessage(BaseModel):
                     "error": "Invalid request",
                 },
             ]
-        }
-    }
+        },
+    )
+
+
+# Built once so the hot path reuses the compiled validator and serializer
+CLIENT_MESSAGE_ADAPTER = TypeAdapter(ClientMessage)
+SERVER_MESSAGE_ADAPTER = TypeAdapter(ServerMessage)
@@ -1,22 +1,53 @@
 """WebSocket server for handling chat connections."""
 
-import json
+from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
 
 from src.adapters.base import LLMAdapter
 from src.mcp.client import MCPClient
 from src.mcp.models import MCPToolCall
+from src.mcp.tools import ToolRegistry
 from src.models.config import Config
 from src.models.messages import (
+    CLIENT_MESSAGE_ADAPTER,
+    SERVER_MESSAGE_ADAPTER,
     ClientMessage,
-    ResponseChunk,
     ResponseStatus,
     ServerMessage,
+    ToolResultChunk,
 )
 from src.utils.logging import get_logger
 
+# Fixed parts of the reply to frames that can't be parsed; only the
+# JSON-encoded error string goes between them
+_ERROR_PREFIX = b'{"status":"error","error":'
+_ERROR_SUFFIX = b"}"
+
+
+async def _receive_frame(websocket: WebSocket) -> str | bytes:
+    """Receive the next client frame without decoding it.
+
+    Text and binary frames are both handed to the JSON validator as
+    received, which saves decoding binary frames to ``str`` first.
+
+    Args:
+        websocket: Client WebSocket connection
+
+    Returns:
+        The frame payload, ``str`` for text frames and ``bytes`` for binary
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    return text if text is not None else message.get("bytes") or b""
+
 
 class WebSocketServer:
     """WebSocket server for handling chat connections."""
@@ -39,6 +70,10 @@ class WebSocketServer:
         self.mcp_clients = mcp_clients or []
         self.logger = get_logger(__name__)
         self.active_connections: dict[str, WebSocket] = {}
+        self._tools_cache: tuple[dict[str, Any], ...] | None = None
+        # Advertised remote tool name -> owning client and bare tool name,
+        # filled in alongside the tool cache
+        self._tool_routes: dict[str, tuple[MCPClient, str]] = {}
 
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
         """Accept WebSocket connection.
@@ -57,8 +92,7 @@ class WebSocketServer:
         Args:
             client_id: Client identifier
         """
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
+        if self.active_connections.pop(client_id, None) is not None:
             self.logger.info("websocket_disconnected", client_id=client_id)
 
     async def handle_message(
@@ -72,19 +106,20 @@ class WebSocketServer:
             websocket: WebSocket connection
             client_id: Client identifier
         """
+        # Bind the connection's context once instead of on every log call
+        log = self.logger.bind(client_id=client_id)
+
         try:
             while True:
-                # Receive message
-                data = await websocket.receive_text()
+                # Receive message; text and binary frames are both accepted
+                data = await _receive_frame(websocket)
 
                 try:
-                    # Parse and validate message
-                    message_data = json.loads(data)
-                    client_message = ClientMessage(**message_data)
+                    # Parse and validate message in a single pass
+                    client_message = CLIENT_MESSAGE_ADAPTER.validate_json(data)
 
-                    self.logger.info(
+                    log.info(
                         "message_received",
-                        client_id=client_id,
                         request_id=client_message.request_id,
                         action=client_message.action,
                     )
@@ -98,51 +133,108 @@ class WebSocketServer:
                         )
                     else:
                         # Unsupported action
-                        error_response = ServerMessage(  # type: ignore[unreachable]
+                        error_response = ServerMessage.model_construct(  # type: ignore[unreachable]
                             request_id=client_message.request_id,
                             status=ResponseStatus.ERROR,
                             error=f"Unsupported action: {client_message.action}",
                             chunk=None,
                         )
-                        await websocket.send_text(error_response.model_dump_json())
+                        await websocket.send_bytes(
+                            SERVER_MESSAGE_ADAPTER.dump_json(error_response)
+                        )
 
                 except ValidationError as e:
-                    # Invalid message format
-                    self.logger.error(
-                        "invalid_message",
-                        client_id=client_id,
-                        error=str(e),
-                    )
-                    error_response = {
-                        "status": "error",
-                        "error": f"Invalid message format: {str(e)}",
-                    }
-                    await websocket.send_text(json.dumps(error_response))
-
-                except json.JSONDecodeError as e:
-                    # Invalid JSON
-                    self.logger.error(
-                        "invalid_json",
-                        client_id=client_id,
-                        error=str(e),
+                    # Malformed JSON is reported as a json_invalid error
+                    if e.errors()[0]["type"] == "json_invalid":
+                        event, prefix = "invalid_json", "Invalid JSON"
+                    else:
+                        event, prefix = "invalid_message", "Invalid message format"
+                    log.error(event, error=str(e))
+                    await websocket.send_bytes(
+                        _ERROR_PREFIX + orjson.dumps(f"{prefix}: {e}") + _ERROR_SUFFIX
                     )
-                    error_response = {
-                        "status": "error",
-                        "error": f"Invalid JSON: {str(e)}",
-                    }
-                    await websocket.send_text(json.dumps(error_response))
 
         except WebSocketDisconnect:
             await self.disconnect(client_id)
         except Exception as e:
-            self.logger.error(
+            log.error(
                 "websocket_error",
-                client_id=client_id,
                 error=str(e),
                 exc_info=True,
             )
             await self.disconnect(client_id)
 
+    def _resolve_mcp_tool(self, name: str) -> tuple[MCPClient, str] | None:
+        """Look up the MCP client that advertised a prefixed tool name.
+
+        Names are matched exactly against the tools offered by _get_tools(),
+        so overlapping server names (e.g. ``a`` and ``a_b``) route correctly.
+
+        Args:
+            name: Tool name in ``<server>_<tool>`` form
+
+        Returns:
+            The owning client and the tool name, or None if no server offers it
+        """
+        return self._tool_routes.get(name)
+
+    async def _get_tools(self) -> tuple[dict[str, Any], ...]:
+        """Get the OpenAI-format tools offered to the model.
+
+        The tuple is built on first use and cached for the server's lifetime,
+        since the MCP clients are fixed at construction; its dicts are
+        shared, so treat them as read-only. Building it also records which
+        client owns each remote tool, for _resolve_mcp_tool().
+
+        Returns:
+            Tools from MCP servers and the local registry
+        """
+        if self._tools_cache is not None:
+            return self._tools_cache
+
+        # Get available tools from MCP servers and local tools
+        tools: list[dict[str, Any]] = []
+        if self.config.mcp.enabled:
+            # Get tools from remote MCP servers, remembering their bare names
+            # so local tools shadowed by a remote one can be skipped
+            covered: set[str] = set()
+            for client in self.mcp_clients:
+                openai_tools = client.to_openai_tools()
+                tools.extend(openai_tools)
+                prefix_len = len(client.config.name) + 1
+                for openai_tool in openai_tools:
+                    name = openai_tool["function"]["name"]
+                    bare_name = name[prefix_len:]
+                    covered.add(bare_name)
+                    self._tool_routes.setdefault(name, (client, bare_name))
+
+            # The first client's combined list includes the local tools;
+            # without clients, take them from the registry directly
+            if self.mcp_clients:
+                combined_tools = await self.mcp_clients[0].get_tools()
+            else:
+                combined_tools = ToolRegistry.get_tools()
+
+            for tool in combined_tools:
+                # Check if this is a local tool
+                # (not already added by to_openai_tools)
+                if tool.name not in covered:
+                    # Add local tool directly
+                    covered.add(tool.name)
+                    tools.append(
+                        {
+                            "type": "function",
+                            "function": {
+                                "name": tool.name,
+                                "description": tool.description,
+                                "parameters": tool.input_schema,
+                            },
+                        }
+                    )
+
+        self._tools_cache = tuple(tools)
+        return self._tools_cache
+
     async def _handle_chat(
         self,
         websocket: WebSocket,
@@ -157,51 +249,7 @@ class WebSocketServer:
             client_id: Client identifier
         """
         try:
-            # Get available tools from MCP servers and local tools
-            tools = []
-            if self.config.mcp.enabled:
-                # Get tools from remote MCP servers
-                for client in self.mcp_clients:
-                    tools.extend(client.to_openai_tools())
-
-                # Get local tools and add them to the tools list
-                if self.mcp_clients:
-                    # Use the first client to get combined tools (includes local)
-                    combined_tools = await self.mcp_clients[0].get_tools()
-                    for tool in combined_tools:
-                        # Check if this is a local tool
-                        # (not already added by to_openai_tools)
-                        if not any(
-                            openai_tool["function"]["name"].endswith(f"_{tool.name}")
-                            for openai_tool in tools
-                        ):
-                            # Add local tool directly
-                            tools.append(
-                                {
-                                    "type": "function",
-                                    "function": {
-                                        "name": tool.name,
-                                        "description": tool.description,
-                                        "parameters": tool.input_schema,
-                                    },
-                                }
-                            )
-                else:
-                    # No MCP clients, get local tools directly
-                    from src.mcp.tools import ToolRegistry
-
-                    local_tools = ToolRegistry.get_tools()
-                    for tool in local_tools:
-                        tools.append(
-                            {
-                                "type": "function",
-                                "function": {
-                                    "name": tool.name,
-                                    "description": tool.description,
-                                    "parameters": tool.input_schema,
-                                },
-                            }
-                        )
+            tools = await self._get_tools()
 
             # Generate response from LLM
             async for response in self.llm_adapter.generate_response(
@@ -211,56 +259,49 @@ class WebSocketServer:
                 use_mcp=bool(tools),  # Enable MCP if we have tools
             ):
                 # Send response chunk
-                await websocket.send_text(response.model_dump_json())
-
-                # Handle tool calls if present
-                if (
-                    response.status == ResponseStatus.CHUNK
-                    and response.chunk
-                    and response.chunk.type == "tool_call"
-                ):
+                await websocket.send_bytes(SERVER_MESSAGE_ADAPTER.dump_json(response))
+
+                # Handle tool calls if present; tool_call chunks only ever
+                # arrive with CHUNK status, so the chunk type alone decides.
+                # The type field is checked rather than the class, since a
+                # plain ResponseChunk may carry a tool call as well
+                chunk = response.chunk
+                if chunk is not None and chunk.type == "tool_call":
                     # Parse tool call
-                    if response.chunk and response.chunk.data:
-                        tool_call_data = json.loads(response.chunk.data)
-
-                        # Find the appropriate MCP client
-                        for mcp_client in self.mcp_clients:
-                            if tool_call_data["name"].startswith(
-                                f"{mcp_client.config.name}_"
-                            ):
-                                # Execute tool
-                                tool_name = tool_call_data["name"].replace(
-                                    f"{mcp_client.config.name}_", ""
-                                )
-                                tool_call = MCPToolCall(
-                                    id=tool_call_data.get("id", ""),
-                                    name=tool_name,
-                                    arguments=tool_call_data.get("arguments", {}),
-                                )
+                    if isinstance(chunk.data, str):
+                        tool_call_data = orjson.loads(chunk.data)
+
+                        # Find the MCP client that owns the prefixed tool name
+                        resolved = self._resolve_mcp_tool(tool_call_data["name"])
+                        if resolved:
+                            mcp_client, tool_name = resolved
+                            tool_call = MCPToolCall(
+                                id=tool_call_data.get("id", ""),
+                                name=tool_name,
+                                arguments=tool_call_data.get("arguments", {}),
+                            )
 
                             result = await mcp_client.call_tool(tool_call)
 
-                            # Send tool result
-                            tool_result_response = ServerMessage(
+                            # Send tool result; every field is built here, so
+                            # skip validation
+                            tool_result_response = ServerMessage.model_construct(
                                 request_id=message.request_id,
                                 status=ResponseStatus.CHUNK,
-                                chunk=ResponseChunk(
+                                chunk=ToolResultChunk.model_construct(
                                     type="tool_result",
-                                    data=json.dumps(
-                                        {
-                                            "tool_call_id": result.tool_call_id,
-                                            "output": result.output,
-                                            "error": result.error,
-                                        }
-                                    ),
+                                    data={
+                                        "tool_call_id": result.tool_call_id,
+                                        "output": result.output,
+                                        "error": result.error,
+                                    },
                                     metadata={},
                                 ),
                                 error=None,
                             )
-                            await websocket.send_text(
-                                tool_result_response.model_dump_json()
+                            await websocket.send_bytes(
+                                SERVER_MESSAGE_ADAPTER.dump_json(tool_result_response)
                             )
-                            break
 
         except Exception as e:
             self.logger.error(
@@ -270,10 +311,10 @@ class WebSocketServer:
                 error=str(e),
                 exc_info=True,
             )
-            error_response = ServerMessage(
+            error_response = ServerMessage.model_construct(
                 request_id=message.request_id,
                 status=ResponseStatus.ERROR,
                 error=f"Chat error: {str(e)}",
                 chunk=None,
             )
-            await websocket.send_text(error_response.model_dump_json())
+            await websocket.send_bytes(SERVER_MESSAGE_ADAPTER.dump_json(error_response))
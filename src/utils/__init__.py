@@ -1,5 +1,6 @@
 """Utility functions and helpers."""
 
-from .logging import get_logger, setup_logging
+from .config_cache import load_config
+from .logging import TokenBucket, get_logger, setup_logging
 
-__all__ = ["get_logger", "setup_logging"]
+__all__ = ["TokenBucket", "get_logger", "load_config", "setup_logging"]
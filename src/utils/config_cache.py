@@ -0,0 +1,43 @@
+"""Cached loading of the YAML application config."""
+
+import os
+
+import yaml
+
+from src.models.config import Config
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Parsed configs keyed by absolute path, tagged with the file's
+# (mtime_ns, size) at parse time
+_CACHE: dict[str, tuple[int, int, Config]] = {}
+
+
+def load_config(path: str) -> Config:
+    """Load a config file, reusing the last parse if the file is unchanged.
+
+    The cache is validated against the file's modification time and size.
+    Each call returns a deep copy, so callers may apply overrides freely.
+
+    Args:
+        path: Path to the YAML config file
+
+    Returns:
+        A fresh copy of the parsed configuration
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+
+    cached = _CACHE.get(key)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        if not yaml.__with_libyaml__:
+            logger.warning(
+                "yaml_libyaml_missing",
+                path=key,
+                message="PyYAML has no libyaml support; using the slower loader",
+            )
+        cached = (stat.st_mtime_ns, stat.st_size, Config.from_yaml(key))
+        _CACHE[key] = cached
+
+    return cached[2].model_copy(deep=True)
@@ -2,14 +2,31 @@
 
 import logging
 import sys
+import time
+from collections.abc import MutableMapping
 from typing import Any
 
 import structlog
 from structlog.processors import CallsiteParameter, CallsiteParameterAdder
 
 
-def setup_logging(level: str = "INFO", format_type: str = "json") -> None:
-    """Set up structured logging configuration."""
+def _drop_exc_info(
+    logger: Any, method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Remove exception info so no traceback is formatted for the event."""
+    event_dict.pop("exc_info", None)
+    return event_dict
+
+
+def setup_logging(
+    level: str = "INFO", format_type: str = "json", tracebacks: bool = False
+) -> None:
+    """Set up structured logging configuration.
+
+    Tracebacks are rendered only when ``tracebacks`` is set or the level is
+    DEBUG; otherwise ``exc_info`` is dropped before formatting, so error
+    bursts don't stall the event loop on traceback rendering.
+    """
     # Configure structlog
     processors = [
         structlog.stdlib.filter_by_level,
@@ -18,15 +35,23 @@ def setup_logging(level: str = "INFO", format_type: str = "json") -> None:
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        CallsiteParameterAdder(
-            parameters=[
-                CallsiteParameter.FILENAME,
-                CallsiteParameter.FUNC_NAME,
-                CallsiteParameter.LINENO,
-            ]
-        ),
     ]
+    if not tracebacks and level.upper() != "DEBUG":
+        processors.append(_drop_exc_info)
+    processors.append(structlog.processors.format_exc_info)
+
+    # Call-site lookup walks the stack on every event; only pay for it when
+    # debugging
+    if level.upper() == "DEBUG":
+        processors.append(
+            CallsiteParameterAdder(
+                parameters=[
+                    CallsiteParameter.FILENAME,
+                    CallsiteParameter.FUNC_NAME,
+                    CallsiteParameter.LINENO,
+                ]
+            )
+        )
 
     if format_type == "json":
         processors.append(structlog.processors.JSONRenderer())
@@ -72,3 +97,38 @@ def log_event(
         elapsed_ms=elapsed_ms,
         **kwargs,
     )
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for expensive logging work.
+
+    Used to decide whether an error log may include a traceback, so a
+    continuously failing dependency can't spend the event loop formatting
+    stack traces.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: float = 1.0) -> None:
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+
+    def allow(self) -> bool:
+        """Take a token if one is available.
+
+        Returns:
+            bool: True if the caller may proceed
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
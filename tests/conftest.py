@@ -0,0 +1,55 @@
+"""Shared test fixtures."""
+
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from src.mcp.tools import web_search
+from src.mcp.tools.registry import ToolRegistry
+from src.utils import config_cache
+
+
+class Clock:
+    """Settable stand-in for time.monotonic."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Replace time.monotonic with a settable clock.
+
+    The start time defaults to 1000.0; parametrize the fixture indirectly
+    to start elsewhere. Only use it in sync tests, since the event loop
+    reads the same clock.
+    """
+    fake = Clock(getattr(request, "param", 1000.0))
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def clear_module_caches() -> Iterator[None]:
+    """Start and end every test with empty module-level caches."""
+    caches = (config_cache._CACHE, web_search._SEARCH_CACHE)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tools registered by a test out of the shared ToolRegistry."""
+    monkeypatch.setattr(ToolRegistry, "_tools", dict(ToolRegistry._tools))
+    monkeypatch.setattr(ToolRegistry, "_definitions", list(ToolRegistry._definitions))
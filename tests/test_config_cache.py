@@ -0,0 +1,87 @@
+"""Tests for cached config loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.models.config import Config
+from src.utils.config_cache import load_config
+
+CONFIG_YAML = """\
+openai:
+  api_key: "test-key"
+  model: "gpt-4o-mini"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Write a minimal config file."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+@pytest.fixture
+def parse_count(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every path Config.from_yaml actually parses."""
+    parsed: list[str] = []
+    from_yaml = Config.from_yaml
+
+    def counting_from_yaml(path: str) -> Config:
+        parsed.append(path)
+        return from_yaml(path)
+
+    monkeypatch.setattr(Config, "from_yaml", counting_from_yaml)
+    return parsed
+
+
+def test_load_config_cache_hit(config_file: Path, parse_count: list[str]) -> None:
+    """Test an unchanged file is parsed only once."""
+    first = load_config(str(config_file))
+    second = load_config(str(config_file))
+
+    assert len(parse_count) == 1
+    assert first == second
+    assert first.openai.model == "gpt-4o-mini"
+
+
+def test_load_config_reparses_on_mtime_change(
+    config_file: Path, parse_count: list[str]
+) -> None:
+    """Test a new modification time invalidates the cached parse."""
+    load_config(str(config_file))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    load_config(str(config_file))
+
+    assert len(parse_count) == 2
+
+
+def test_load_config_reparses_on_size_change(
+    config_file: Path, parse_count: list[str]
+) -> None:
+    """Test a new file size invalidates the cache even with the same mtime."""
+    load_config(str(config_file))
+    stat = config_file.stat()
+    config_file.write_text(CONFIG_YAML.replace("gpt-4o-mini", "gpt-4o"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    config = load_config(str(config_file))
+
+    assert len(parse_count) == 2
+    assert config.openai.model == "gpt-4o"
+
+
+def test_load_config_returns_isolated_copies(config_file: Path) -> None:
+    """Test overrides applied to one result don't leak into the next."""
+    config = load_config(str(config_file))
+    config.openai.api_key = "override"
+    config.server.cors_origins.append("http://example.com")
+
+    fresh = load_config(str(config_file))
+
+    assert fresh.openai.api_key == "test-key"
+    assert "http://example.com" not in fresh.server.cors_origins
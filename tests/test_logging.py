@@ -0,0 +1,35 @@
+"""Tests for logging utilities."""
+
+from src.utils.logging import TokenBucket
+from tests.conftest import Clock
+
+
+def test_token_bucket_starts_full(clock: Clock) -> None:
+    """Test a new bucket allows up to its capacity at once."""
+    bucket = TokenBucket(rate=1.0, capacity=2.0)
+
+    assert bucket.allow()
+    assert bucket.allow()
+    assert not bucket.allow()
+
+
+def test_token_bucket_refills_at_rate(clock: Clock) -> None:
+    """Test tokens come back at the configured rate."""
+    bucket = TokenBucket(rate=2.0)
+    assert bucket.allow()
+
+    clock.advance(0.25)
+    assert not bucket.allow()
+
+    clock.advance(0.25)
+    assert bucket.allow()
+
+
+def test_token_bucket_caps_at_capacity(clock: Clock) -> None:
+    """Test a long idle period doesn't bank more than the capacity."""
+    bucket = TokenBucket(rate=1.0, capacity=1.0)
+    assert bucket.allow()
+
+    clock.advance(3600)
+    assert bucket.allow()
+    assert not bucket.allow()
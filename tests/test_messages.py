@@ -9,6 +9,8 @@ from src.models.messages import (
     ResponseChunk,
     ResponseStatus,
     ServerMessage,
+    TextChunk,
+    ToolCallChunk,
 )
 
 
@@ -66,6 +68,47 @@ def test_server_message_chunk() -> None:
         assert message.chunk.data == "Response text"
 
 
+def test_server_message_tool_result_object() -> None:
+    """Test tool_result chunk data serializes as a nested object."""
+    message = ServerMessage(
+        request_id="test-123",
+        status=ResponseStatus.CHUNK,
+        chunk=ResponseChunk(
+            type="tool_result",
+            data={"tool": "web_search", "status": "complete"},
+            metadata={"tool_id": "call_1"},
+        ),
+        error=None,
+    )
+    assert message.chunk is not None
+    assert message.chunk.data == {"tool": "web_search", "status": "complete"}
+    assert '"data":{"tool":"web_search","status":"complete"}' in (
+        message.model_dump_json()
+    )
+
+
+def test_server_message_chunk_discriminated() -> None:
+    """Test typed chunks are parsed into their tagged model."""
+    message = ServerMessage.model_validate_json(
+        '{"request_id": "test-123", "status": "chunk",'
+        ' "chunk": {"type": "tool_call", "data": "{}"}}'
+    )
+    assert isinstance(message.chunk, ToolCallChunk)
+
+    message = ServerMessage.model_validate_json(
+        '{"request_id": "test-123", "status": "chunk",'
+        ' "chunk": {"type": "text", "data": "Hi"}}'
+    )
+    assert isinstance(message.chunk, TextChunk)
+
+    # Untyped chunks still validate against the base model
+    message = ServerMessage.model_validate_json(
+        '{"request_id": "test-123", "status": "processing",'
+        ' "chunk": {"metadata": {"user_message": "Hello"}}}'
+    )
+    assert type(message.chunk) is ResponseChunk
+
+
 def test_server_message_error() -> None:
     """Test ServerMessage with error."""
     message = ServerMessage(
@@ -0,0 +1,410 @@
+"""Tests for the OpenAI adapter."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, Choice
+
+from src.adapters import openai_adapter
+from src.adapters.openai_adapter import ToolResult, _stream_events
+from src.mcp.models import MCPTool, MCPToolCall, MCPToolResult
+from src.mcp.tools.registry import MCPToolHandler, ToolRegistry
+from src.models.config import OpenAIConfig
+from src.models.messages import ResponseStatus, TextChunk, ToolResultChunk
+
+
+def make_chunk(delta: dict[str, Any], finish: str | None = None) -> ChatCompletionChunk:
+    """Build a streamed chat completion chunk with a single choice."""
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "chunk",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "test-model",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+        }
+    )
+
+
+class FakeStream:
+    """Stand-in for openai.AsyncStream that records how it was consumed."""
+
+    def __init__(
+        self,
+        chunks: list[ChatCompletionChunk],
+        delay: float = 0.0,
+        error: Exception | None = None,
+        endless: bool = False,
+    ) -> None:
+        self.chunks = chunks
+        self.delay = delay
+        self.error = error
+        self.endless = endless
+        self.closed = False
+        self.finished = False
+
+    def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[ChatCompletionChunk]:
+        try:
+            while True:
+                for chunk in self.chunks:
+                    await asyncio.sleep(self.delay)
+                    yield chunk
+                if not self.endless:
+                    break
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.finished = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def collect(stream: FakeStream) -> list[str | Choice]:
+    """Drain _stream_events into a list."""
+    return [event async for event in _stream_events(stream)]  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def slow_interval(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make interval-based release effectively never happen."""
+    monkeypatch.setattr(openai_adapter, "_COALESCE_INTERVAL_S", 60.0)
+
+
+@pytest.mark.usefixtures("slow_interval")
+async def test_stream_events_release_by_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test buffered text is released once the size limit is reached."""
+    monkeypatch.setattr(openai_adapter, "_COALESCE_MAX_CHARS", 4)
+    stream = FakeStream([make_chunk({"content": text}) for text in "abcdef"])
+
+    assert await collect(stream) == ["abcd", "ef"]
+    assert stream.closed
+
+
+async def test_stream_events_release_by_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test buffered text is released once the interval has passed."""
+    monkeypatch.setattr(openai_adapter, "_COALESCE_INTERVAL_S", 0.01)
+    stream = FakeStream([make_chunk({"content": text}) for text in "ab"], delay=0.05)
+
+    assert await collect(stream) == ["a", "b"]
+
+
+@pytest.mark.usefixtures("slow_interval")
+async def test_stream_events_flush_before_tool_call() -> None:
+    """Test buffered text is yielded ahead of a tool-call choice."""
+    tool_delta = {
+        "tool_calls": [
+            {
+                "index": 0,
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "web_search", "arguments": "{}"},
+            }
+        ]
+    }
+    stream = FakeStream(
+        [
+            make_chunk({"content": "Let me "}),
+            make_chunk({"content": "check."}),
+            make_chunk(tool_delta),
+            make_chunk({}, finish="tool_calls"),
+        ]
+    )
+
+    events = await collect(stream)
+
+    assert events[0] == "Let me check."
+    assert isinstance(events[1], Choice)
+    assert events[1].delta.tool_calls is not None
+    assert isinstance(events[2], Choice)
+    assert events[2].finish_reason == "tool_calls"
+    assert len(events) == 3
+
+
+@pytest.mark.usefixtures("slow_interval")
+async def test_stream_events_flush_before_finish() -> None:
+    """Test buffered text is yielded ahead of the finish choice."""
+    stream = FakeStream([make_chunk({"content": "Hi"}), make_chunk({}, finish="stop")])
+
+    events = await collect(stream)
+
+    assert events[0] == "Hi"
+    assert isinstance(events[1], Choice)
+    assert events[1].finish_reason == "stop"
+
+
+@pytest.mark.usefixtures("slow_interval")
+async def test_stream_events_error_flushes_text() -> None:
+    """Test text buffered before a stream error still reaches the caller."""
+    stream = FakeStream([make_chunk({"content": "x"})], error=RuntimeError("boom"))
+    events: list[str | Choice] = []
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for event in _stream_events(stream):  # type: ignore[arg-type]
+            events.append(event)
+
+    assert events == ["x"]
+    assert stream.closed
+
+
+async def test_stream_events_early_close() -> None:
+    """Test closing the generator early stops the reader and the stream."""
+    stream = FakeStream([make_chunk({"content": "tick"})], delay=0.001, endless=True)
+    events = _stream_events(stream)  # type: ignore[arg-type]
+
+    first = await anext(events)
+    assert isinstance(first, str) and first.startswith("tick")
+    await events.aclose()
+
+    assert stream.finished
+    assert stream.closed
+
+
+def tool_call_stream() -> FakeStream:
+    """First-phase stream with text and two tool calls streamed in fragments."""
+    return FakeStream(
+        [
+            make_chunk({"role": "assistant", "content": "Searching. "}),
+            make_chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": "call_a",
+                            "type": "function",
+                            "function": {"name": "web_search", "arguments": ""},
+                        }
+                    ]
+                }
+            ),
+            make_chunk(
+                {"tool_calls": [{"index": 0, "function": {"arguments": '{"query":'}}]}
+            ),
+            make_chunk(
+                {"tool_calls": [{"index": 0, "function": {"arguments": '"a"}'}}]}
+            ),
+            make_chunk(
+                {
+                    "tool_calls": [
+                        {
+                            "index": 1,
+                            "id": "call_b",
+                            "type": "function",
+                            "function": {
+                                "name": "web_search",
+                                "arguments": '{"query":"b"}',
+                            },
+                        }
+                    ]
+                }
+            ),
+            make_chunk({}, finish="tool_calls"),
+        ]
+    )
+
+
+class FakeCompletions:
+    """Records create() calls and serves the two phases of the MCP flow."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def create(self, **params: Any) -> FakeStream:
+        self.calls.append(params)
+        if len(self.calls) == 1:
+            return tool_call_stream()
+        return FakeStream([make_chunk({"content": "Done."}), make_chunk({}, "stop")])
+
+
+@pytest.fixture
+def adapter(monkeypatch: pytest.MonkeyPatch) -> openai_adapter.OpenAIAdapter:
+    """Adapter whose chat completions are served by FakeCompletions."""
+    adapter = openai_adapter.OpenAIAdapter(OpenAIConfig(api_key="test-key"))
+    monkeypatch.setattr(adapter.client.chat, "completions", FakeCompletions())
+    return adapter
+
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {"name": "web_search", "description": "", "parameters": {}},
+    }
+]
+
+
+async def test_mcp_flow_executes_tools_in_order(
+    adapter: openai_adapter.OpenAIAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test streamed tool calls run in index order with complete arguments."""
+    started: list[dict[str, Any]] = []
+
+    async def execute(tool_call: dict[str, Any]) -> ToolResult:
+        started.append(tool_call)
+        return ToolResult(status="success", result=tool_call["id"])
+
+    monkeypatch.setattr(adapter, "execute_mcp_tool", execute)
+
+    messages = [m async for m in adapter.generate_response("hi", "req-1", TOOLS)]
+
+    assert [call["id"] for call in started] == ["call_a", "call_b"]
+    assert started[0]["function"]["arguments"] == '{"query":"a"}'
+    assert messages[-1].status == ResponseStatus.COMPLETE
+    # First-phase text is streamed to the client as it arrives
+    texts = [m.chunk.data for m in messages if isinstance(m.chunk, TextChunk)]
+    assert "Searching. " in texts
+    assert "Done." in texts
+    results = [m.chunk for m in messages if isinstance(m.chunk, ToolResultChunk)]
+    assert [chunk.metadata for chunk in results] == [
+        {"tool_id": "call_a"},
+        {"tool_id": "call_b"},
+    ]
+
+
+async def test_mcp_flow_second_phase_messages(
+    adapter: openai_adapter.OpenAIAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the second phase gets the assistant tool calls and their results."""
+
+    async def execute(tool_call: dict[str, Any]) -> ToolResult:
+        if tool_call["id"] == "call_b":
+            raise RuntimeError("search failed")
+        return ToolResult(status="success", result={"hits": 1})
+
+    monkeypatch.setattr(adapter, "execute_mcp_tool", execute)
+
+    async for _ in adapter.generate_response("hi", "req-1", TOOLS):
+        pass
+
+    completions = adapter.client.chat.completions
+    assert isinstance(completions, FakeCompletions)
+    assert len(completions.calls) == 2
+    assert completions.calls[1]["messages"] == [
+        {"role": "system", "content": adapter.config.system_prompt},
+        {"role": "user", "content": "hi"},
+        {
+            "role": "assistant",
+            "content": "Searching. ",
+            "tool_calls": [
+                {
+                    "id": "call_a",
+                    "type": "function",
+                    "function": {"name": "web_search", "arguments": '{"query":"a"}'},
+                },
+                {
+                    "id": "call_b",
+                    "type": "function",
+                    "function": {"name": "web_search", "arguments": '{"query":"b"}'},
+                },
+            ],
+        },
+        {
+            "tool_call_id": "call_a",
+            "role": "tool",
+            "content": '{"status":"success","result":{"hits":1},"error":null}',
+        },
+        {
+            "tool_call_id": "call_b",
+            "role": "tool",
+            "content": '{"error":"search failed"}',
+        },
+    ]
+
+
+async def test_mcp_flow_cancels_tools_on_close(
+    adapter: openai_adapter.OpenAIAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test running tools are cancelled when the consumer stops early."""
+    cancelled: list[str] = []
+
+    async def execute(tool_call: dict[str, Any]) -> ToolResult:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(tool_call["id"])
+            raise
+        raise AssertionError("unreachable")
+
+    monkeypatch.setattr(adapter, "execute_mcp_tool", execute)
+
+    responses = adapter.generate_response("hi", "req-1", TOOLS)
+    async for message in responses:
+        chunk = message.chunk
+        if chunk is not None and chunk.metadata.get("phase") == "tool_execution":
+            break
+    # Let both tool tasks start before the consumer goes away
+    await asyncio.sleep(0)
+    await responses.aclose()
+
+    assert sorted(cancelled) == ["call_a", "call_b"]
+
+
+class SlowLocalTool(MCPToolHandler):
+    """Local tool that takes most of the tool budget."""
+
+    runs = 0
+
+    @classmethod
+    def get_definition(cls) -> MCPTool:
+        return MCPTool(name="slow_tool", description="Slow", input_schema={})
+
+    @classmethod
+    async def execute(cls, tool_call: MCPToolCall) -> MCPToolResult:
+        cls.runs += 1
+        await asyncio.sleep(0.15)
+        return MCPToolResult(tool_call_id=tool_call.id, output="done")
+
+
+class RemoteClient:
+    """MCP client stand-in that records remote calls."""
+
+    def __init__(self, name: str) -> None:
+        self.config = SimpleNamespace(name=name)
+        self.calls: list[MCPToolCall] = []
+
+    async def call_tool(self, tool_call: MCPToolCall) -> MCPToolResult:
+        self.calls.append(tool_call)
+        return MCPToolResult(tool_call_id=tool_call.id, output=None, error="not found")
+
+
+@pytest.mark.usefixtures("isolated_registry")
+async def test_execute_mcp_tool_runs_local_tool_once(
+    adapter: openai_adapter.OpenAIAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a local tool gets the full budget, not a per-client share."""
+    ToolRegistry.register(SlowLocalTool)
+    clients = [RemoteClient("x"), RemoteClient("y")]
+    monkeypatch.setattr(openai_adapter, "_get_mcp_clients", lambda: clients)
+    adapter.tool_timeout = 0.2
+
+    result = await adapter.execute_mcp_tool(
+        {"id": "call_1", "function": {"name": "slow_tool", "arguments": "{}"}}
+    )
+
+    assert result.status == "success"
+    assert result.result == "done"
+    assert SlowLocalTool.runs == 1
+    assert not any(client.calls for client in clients)
+
+
+async def test_execute_mcp_tool_tries_remote_clients(
+    adapter: openai_adapter.OpenAIAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test tools unknown locally are tried on each remote client."""
+    clients = [RemoteClient("x"), RemoteClient("y")]
+    monkeypatch.setattr(openai_adapter, "_get_mcp_clients", lambda: clients)
+
+    result = await adapter.execute_mcp_tool(
+        {"id": "call_1", "function": {"name": "x_remote", "arguments": "{}"}}
+    )
+
+    assert result.status == "error"
+    assert result.error == "not found"
+    assert [len(client.calls) for client in clients] == [1, 1]
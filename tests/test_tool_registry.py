@@ -0,0 +1,41 @@
+"""Tests for the MCP tool registry."""
+
+import pytest
+
+from src.mcp.models import MCPTool, MCPToolCall, MCPToolResult
+from src.mcp.tools.registry import MCPToolHandler, ToolRegistry
+
+pytestmark = pytest.mark.usefixtures("isolated_registry")
+
+
+class EchoTool(MCPToolHandler):
+    """Tool with a mixed-case name."""
+
+    @classmethod
+    def get_definition(cls) -> MCPTool:
+        return MCPTool(name="Echo_Text", description="Echo", input_schema={})
+
+    @classmethod
+    async def execute(cls, tool_call: MCPToolCall) -> MCPToolResult:
+        return MCPToolResult(tool_call_id=tool_call.id, output=tool_call.arguments)
+
+
+def test_get_tool_ignores_case() -> None:
+    """Test tools are found regardless of the name's case."""
+    ToolRegistry.register(EchoTool)
+
+    assert ToolRegistry.get_tool("Echo_Text") is EchoTool
+    assert ToolRegistry.get_tool("echo_text") is EchoTool
+    assert ToolRegistry.get_tool("ECHO_TEXT") is EchoTool
+    assert ToolRegistry.get_tool("echo") is None
+
+
+def test_get_tools_returns_copy() -> None:
+    """Test the definitions list can't be changed through get_tools."""
+    ToolRegistry.register(EchoTool)
+
+    tools = ToolRegistry.get_tools()
+    assert "Echo_Text" in [tool.name for tool in tools]
+
+    tools.clear()
+    assert ToolRegistry.get_tools()
@@ -0,0 +1,74 @@
+"""Tests for the web search tool."""
+
+import pytest
+
+from src.mcp.models import MCPToolCall
+from src.mcp.tools import web_search
+from src.mcp.tools.web_search import WebSearchTool, _cache_get, _cache_put
+from tests.conftest import Clock
+
+
+def test_cache_hit() -> None:
+    """Test stored results are returned for the same key."""
+    _cache_put(("python", 5), [{"title": "Python"}])
+
+    assert _cache_get(("python", 5)) == [{"title": "Python"}]
+    assert _cache_get(("python", 3)) is None
+
+
+@pytest.mark.parametrize("clock", [0.0, 1e9], indirect=True)
+def test_cache_expires_after_ttl(clock: Clock) -> None:
+    """Test entries older than the TTL are dropped, whatever the clock origin."""
+    _cache_put(("python", 5), [])
+
+    clock.advance(web_search._SEARCH_TTL_S - 1)
+    assert _cache_get(("python", 5)) == []
+
+    clock.advance(1)
+    assert _cache_get(("python", 5)) is None
+    assert ("python", 5) not in web_search._SEARCH_CACHE
+
+
+def test_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the oldest unused entry is evicted once the cap is exceeded."""
+    monkeypatch.setattr(web_search, "_SEARCH_CACHE_MAX", 2)
+    _cache_put(("a", 5), ["a"])
+    _cache_put(("b", 5), ["b"])
+
+    # Reading "a" makes "b" the least recently used
+    assert _cache_get(("a", 5)) == ["a"]
+    _cache_put(("c", 5), ["c"])
+
+    assert _cache_get(("b", 5)) is None
+    assert _cache_get(("a", 5)) == ["a"]
+    assert _cache_get(("c", 5)) == ["c"]
+
+
+class FakeDDGS:
+    """DDGS stand-in that counts searches."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def text(self, query: str, max_results: int) -> list[dict[str, str]]:
+        self.queries.append(query)
+        return [{"title": "Title", "body": "Snippet", "href": "https://example.com"}]
+
+
+async def test_execute_reuses_cached_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a repeated query is answered from the cache, ignoring case."""
+    ddgs = FakeDDGS()
+    monkeypatch.setattr(web_search, "_get_ddgs", lambda: ddgs)
+
+    first = await WebSearchTool.execute(
+        MCPToolCall(id="call_1", name="web_search", arguments={"query": "Python"})
+    )
+    second = await WebSearchTool.execute(
+        MCPToolCall(id="call_2", name="web_search", arguments={"query": " python "})
+    )
+
+    assert ddgs.queries == ["Python"]
+    assert first.error is None and second.error is None
+    assert isinstance(first.output, dict) and isinstance(second.output, dict)
+    assert second.output["results"] == first.output["results"]
+    assert second.output["query"] == " python "
@@ -0,0 +1,129 @@
+"""Tests for the WebSocket server."""
+
+from collections.abc import AsyncGenerator
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+
+from src.mcp.models import MCPTool, MCPToolCall, MCPToolResult
+from src.models.config import Config, OpenAIConfig
+from src.models.messages import (
+    ChatPayload,
+    ClientMessage,
+    ResponseChunk,
+    ResponseStatus,
+    ServerMessage,
+)
+from src.server.websocket_server import WebSocketServer
+
+
+class FakeMCPClient:
+    """MCP client stand-in that records the tool calls it receives."""
+
+    def __init__(self, name: str, tools: list[str]) -> None:
+        self.config = SimpleNamespace(name=name)
+        self.tools = tools
+        self.calls: list[MCPToolCall] = []
+
+    def to_openai_tools(self) -> tuple[dict[str, Any], ...]:
+        return tuple(
+            {"type": "function", "function": {"name": f"{self.config.name}_{tool}"}}
+            for tool in self.tools
+        )
+
+    async def get_tools(self) -> list[MCPTool]:
+        return []
+
+    async def call_tool(self, tool_call: MCPToolCall) -> MCPToolResult:
+        self.calls.append(tool_call)
+        return MCPToolResult(tool_call_id=tool_call.id, output="ok")
+
+
+class FakeAdapter:
+    """LLM adapter stand-in that replays fixed server messages."""
+
+    def __init__(self, messages: list[ServerMessage]) -> None:
+        self.messages = messages
+
+    async def generate_response(self, **kwargs: Any) -> AsyncGenerator[ServerMessage]:
+        for message in self.messages:
+            yield message
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that collects sent frames."""
+
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+def make_server(
+    clients: list[FakeMCPClient], messages: list[ServerMessage] | None = None
+) -> WebSocketServer:
+    """Build a server whose tools come only from the given clients."""
+    config = Config(openai=OpenAIConfig(api_key="test-key"))
+    return WebSocketServer(
+        config,
+        FakeAdapter(messages or []),  # type: ignore[arg-type]
+        clients,  # type: ignore[arg-type]
+    )
+
+
+async def test_handle_chat_plain_tool_call_chunk() -> None:
+    """Test a tool call in an untyped ResponseChunk is still executed."""
+    client = FakeMCPClient("search", ["web"])
+    tool_call = {"id": "call_1", "name": "search_web", "arguments": {"q": "x"}}
+    server = make_server(
+        [client],
+        [
+            ServerMessage(
+                request_id="req-1",
+                status=ResponseStatus.CHUNK,
+                chunk=ResponseChunk(
+                    type="tool_call", data=orjson.dumps(tool_call).decode()
+                ),
+            )
+        ],
+    )
+    websocket = FakeWebSocket()
+    message = ClientMessage(
+        action="chat", payload=ChatPayload(text="hi"), request_id="req-1"
+    )
+
+    await server._handle_chat(websocket, message, "client-1")  # type: ignore[arg-type]
+
+    assert [call.name for call in client.calls] == ["web"]
+    assert client.calls[0].arguments == {"q": "x"}
+    # The result is a nested object, not JSON encoded inside a string
+    frame = orjson.loads(websocket.sent[-1])
+    assert frame["chunk"]["type"] == "tool_result"
+    assert frame["chunk"]["data"] == {
+        "tool_call_id": "call_1",
+        "output": "ok",
+        "error": None,
+    }
+
+
+async def test_resolve_mcp_tool_overlapping_server_names() -> None:
+    """Test a tool routes to the server that advertised it."""
+    short, long = FakeMCPClient("a", ["other"]), FakeMCPClient("a_b", ["tool"])
+    server = make_server([short, long])
+    await server._get_tools()
+
+    assert server._resolve_mcp_tool("a_b_tool") == (long, "tool")
+    assert server._resolve_mcp_tool("a_other") == (short, "other")
+
+
+async def test_resolve_mcp_tool_no_match() -> None:
+    """Test names no server advertised resolve to None."""
+    server = make_server([FakeMCPClient("search", ["web"])])
+    await server._get_tools()
+
+    assert server._resolve_mcp_tool("search_images") is None
+    assert server._resolve_mcp_tool("other_tool") is None
+    assert server._resolve_mcp_tool("tool") is None
+    assert server._resolve_mcp_tool("_search") is None